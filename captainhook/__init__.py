@@ -4,62 +4,79 @@ CaptainHook - Cheatcode-style extensibility for Python
 Reference: Busy38 cheatcode system
 """
 
+import importlib
+
 from .core import (
     Context,
     register,
     register_container,
     execute_async,
     execute,
+    execute_tag,
+    execute_tag_async,
     execute_text,
+    execute_text_async,
+    iter_execute_text,
     register_namespace,
     unregister_namespace,
     execute_cheatcode,
     get_no_response,
 )
 from .parser import (
+    ParseError,
     Tag,
     TagType,
     parse_tag,
     parse_all,
+    iter_tags,
+    parse_container_tags,
+    parse_self_closing,
+    parse_cheatcodes,
     is_valid_tag,
     remove_tags,
 )
 from .hooks import Hooks
 from .filters import Filters
-from .busy_bridge import (
-    busy38_hooks,
-    cheatcode_registry,
-    HookPoints,
-    NamespaceHandler,
-    NamespaceRegistry,
-    get_namespace_metadata,
-    on_pre_agent_execute,
-    on_post_agent_execute,
-    on_pre_llm_call,
-    on_post_llm_call,
-    filter_llm_response,
-    on_pre_note_create,
-    on_post_note_create,
-    filter_note_content,
-    on_pre_tool_execute,
-    on_post_tool_execute,
-    filter_tool_result,
-    on_pre_cheatcode_execute,
-    on_post_cheatcode_execute,
-    on_orchestration_status,
-    on_heartbeat_register_jobs,
-    on_heartbeat_tick_start,
-    on_heartbeat_tick_complete,
-    on_heartbeat_job_start,
-    on_heartbeat_job_complete,
-    on_heartbeat_job_error,
-    on_heartbeat_legacy_check,
-    emit,
-    apply,
-    list_busy38_hooks,
-    get_busy38_stats,
-    get_namespace,
-    should_suppress_cheatcode_response,
+# Busy38 bridge exports are resolved on first access (PEP 562) so importing
+# the core engine does not load the bridge registry module.
+_BUSY_BRIDGE_EXPORTS = frozenset(
+    {
+        "busy38_hooks",
+        "cheatcode_registry",
+        "HookPoints",
+        "NamespaceHandler",
+        "NamespaceRegistry",
+        "get_namespace_metadata",
+        "on_pre_agent_execute",
+        "on_post_agent_execute",
+        "on_pre_llm_call",
+        "on_post_llm_call",
+        "filter_llm_response",
+        "on_pre_note_create",
+        "on_post_note_create",
+        "filter_note_content",
+        "on_pre_tool_execute",
+        "on_post_tool_execute",
+        "filter_tool_result",
+        "on_pre_cheatcode_execute",
+        "on_post_cheatcode_execute",
+        "on_orchestration_status",
+        "on_heartbeat_register_jobs",
+        "on_heartbeat_tick_start",
+        "on_heartbeat_tick_complete",
+        "on_heartbeat_job_start",
+        "on_heartbeat_job_complete",
+        "on_heartbeat_job_error",
+        "on_heartbeat_legacy_check",
+        "register_hooks",
+        "emit",
+        "emit_async",
+        "apply",
+        "list_busy38_hooks",
+        "get_busy38_stats",
+        "get_namespace",
+        "should_suppress_cheatcode_response",
+    }
 )
 
 __version__ = "0.1.0"
@@ -71,17 +88,26 @@ __all__ = [
     "register",
     "register_container",
     "execute",
+    "execute_tag",
     "execute_text",
+    "iter_execute_text",
     "execute_async",
+    "execute_tag_async",
+    "execute_text_async",
     "register_namespace",
     "unregister_namespace",
     "execute_cheatcode",
     "get_no_response",
     # Parser
+    "ParseError",
     "Tag",
     "TagType",
     "parse_tag",
     "parse_all",
+    "iter_tags",
+    "parse_container_tags",
+    "parse_self_closing",
+    "parse_cheatcodes",
     "is_valid_tag",
     "remove_tags",
     # Hooks/Filters
@@ -114,7 +140,9 @@ __all__ = [
     "on_heartbeat_job_complete",
     "on_heartbeat_job_error",
     "on_heartbeat_legacy_check",
+    "register_hooks",
     "emit",
+    "emit_async",
     "apply",
     "list_busy38_hooks",
     "get_busy38_stats",
@@ -122,3 +150,16 @@ __all__ = [
     "get_namespace_metadata",
     "should_suppress_cheatcode_response",
 ]
+
+
+def __getattr__(name):
+    if name in _BUSY_BRIDGE_EXPORTS:
+        module = importlib.import_module(".busy_bridge", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _BUSY_BRIDGE_EXPORTS)
@@ -3,38 +3,119 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import inspect
-from types import MappingProxyType
-from typing import Any, Callable, Dict, List, Optional
+import re
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from .parser import ParseError, Tag, TagType, parse_all, parse_tag
+from .parser import Tag, TagType, parse_all, parse_tag
 from .hooks import Hooks
 from .filters import Filters
 
 
-def _freeze_kwargs(values: Dict[str, Any]) -> Dict[str, Any]:
-    return dict(MappingProxyType(dict(values)))
+_PARSE_CACHE_MAX_LEN = 4096
+_parse_tag_cached = functools.lru_cache(maxsize=1024)(parse_tag)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_all_cached(text: str) -> Tuple[Tag, ...]:
+    return tuple(parse_all(text))
+
+
+def _copy_tag(tag: Tag) -> Tag:
+    return dataclasses.replace(tag, params=list(tag.params), attributes=dict(tag.attributes))
+
+
+def _parse_tag(tag_string: str) -> Tag:
+    # Agent loops re-execute the same short tags; memoize those parses. Tag is
+    # mutable, so every caller gets its own copy of the cached result. Long
+    # strings (container bodies) bypass the cache. ParseError is never cached.
+    if len(tag_string) > _PARSE_CACHE_MAX_LEN:
+        return parse_tag(tag_string)
+    return _copy_tag(_parse_tag_cached(tag_string))
+
+
+def _parse_all(text: str) -> List[Tag]:
+    # Same policy as _parse_tag, for resubmitted messages and templates.
+    if len(text) > _PARSE_CACHE_MAX_LEN:
+        return parse_all(text)
+    return [_copy_tag(tag) for tag in _parse_all_cached(text)]
+
+
+_bridge_module = None
+# The bridge's cheatcode hook points, fetched once alongside the bridge import
+# so each emit passes the constant instead of resolving it by name.
+_PRE_CHEATCODE_POINT: Optional[str] = None
+_POST_CHEATCODE_POINT: Optional[str] = None
+
+
+def _bridge():
+    """Return the busy_bridge module, imported on first use and then cached.
+
+    Deferred so `import captainhook` does not load the bridge registries; None
+    only if the bridge cannot be imported at all.
+    """
+    global _bridge_module, _PRE_CHEATCODE_POINT, _POST_CHEATCODE_POINT
+    if _bridge_module is None:
+        try:
+            from . import busy_bridge
+        except ImportError:
+            return None
+        _PRE_CHEATCODE_POINT = busy_bridge.HookPoints.PRE_CHEATCODE_EXECUTE
+        _POST_CHEATCODE_POINT = busy_bridge.HookPoints.POST_CHEATCODE_EXECUTE
+        _bridge_module = busy_bridge
+    return _bridge_module
+
+
+# Sentinel for single-probe dict.pop/get where None is a valid stored value.
+_MISSING = object()
+
+# Metadata keys that may hold per-action dicts, in lookup order.
+_META_ACTION_CONTAINERS = ("actions", "action_metadata", "action_metadata_by_name")
+
+# ASCII-only and length-bounded, matching busy_bridge; str.isalnum() accepted
+# any Unicode letter. The length check runs before the memoized check.
+_IDENTIFIER_MAX_LEN = 128
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_-]{0,%d}" % (_IDENTIFIER_MAX_LEN - 1))
 
 
 def _validate_identifier(value: str) -> None:
     if not value:
         raise ValueError("Empty identifier is not allowed")
+    if len(value) > _IDENTIFIER_MAX_LEN:
+        raise ValueError(f"Identifier exceeds {_IDENTIFIER_MAX_LEN} characters")
+    _check_identifier(value)
+
+
+# Only successful validations are memoized: lru_cache does not store raised
+# exceptions, so invalid input is re-checked (and rejected) on every call.
+@functools.lru_cache(maxsize=4096)
+def _check_identifier(value: str) -> bool:
     if value.startswith("__") or value.endswith("__"):
         raise ValueError(f"Invalid identifier '{value}'")
-    if not (value[0].isalpha() or value[0] == "_"):
+    if _IDENTIFIER_RE.fullmatch(value) is None:
         raise ValueError(f"Invalid identifier '{value}'")
-    for char in value:
-        if not (char.isalnum() or char in {"_", "-"}):
-            raise ValueError(f"Invalid identifier '{value}'")
+    return True
 
 
 def _merge_call_kwargs(tag_attrs: Dict[str, str], runtime_kwargs: Dict[str, Any]) -> Dict[str, Any]:
-    overlap = set(tag_attrs) & set(runtime_kwargs)
-    if overlap:
-        raise ValueError(f"Tag data overlaps runtime keys: {sorted(overlap)}")
+    # The result is always splatted (**merged), which copies it into the
+    # callee's own kwargs dict, so returning an input mapping is safe.
+    if not runtime_kwargs:
+        return tag_attrs
+    if not tag_attrs:
+        return runtime_kwargs
+    # Tags carry a handful of attributes; probing each one avoids building two
+    # sets on the (common) no-overlap path.
+    for key in tag_attrs:
+        if key in runtime_kwargs:
+            overlap = sorted(k for k in tag_attrs if k in runtime_kwargs)
+            raise ValueError(f"Tag data overlaps runtime keys: {overlap}")
     merged = dict(runtime_kwargs)
     merged.update(tag_attrs)
-    return _freeze_kwargs(merged)
+    return merged
 
 
 def _validate_tag_values(tag: Tag) -> None:
@@ -50,6 +131,18 @@ class Context:
     Isolated execution context for CaptainHook control tags.
     """
 
+    __slots__ = (
+        "_handlers",
+        "_namespace_handlers",
+        "_namespace_metadata",
+        "_container_handlers",
+        "_apply_filters",
+        "hooks",
+        "filters",
+        "_tag_dispatch",
+        "_parallel_keys",
+    )
+
     def __init__(self, apply_filters: bool = False):
         self._handlers: Dict[str, Callable] = {}
         self._namespace_handlers: Dict[str, Any] = {}
@@ -58,8 +151,21 @@ class Context:
         self._apply_filters = apply_filters
         self.hooks = Hooks()
         self.filters = Filters()
-
-    def register(self, pattern: str):
+        # Bound per instance so subclass overrides of _execute_* still apply.
+        self._tag_dispatch: Dict[TagType, Callable[..., Any]] = {
+            TagType.DOUBLE: self._execute_container,
+            TagType.CHEATCODE: self._execute_cheatcode,
+            TagType.SINGLE: self._execute_simple,
+        }
+        # Handler keys registered with parallel=True; see execute_text_async.
+        self._parallel_keys: set = set()
+
+    def register(self, pattern: str, parallel: bool = False):
+        """Register a handler for `pattern`.
+
+        `parallel=True` declares the handler independent of neighbouring tags,
+        so `execute_text_async` may await it concurrently with them.
+        """
         if ":" in pattern:
             namespace, action = pattern.split(":", 1)
             _validate_identifier(namespace)
@@ -68,7 +174,12 @@ class Context:
             _validate_identifier(pattern)
 
         def decorator(func: Callable):
-            self._handlers[pattern] = func
+            key = sys.intern(pattern)
+            self._handlers[key] = func
+            if parallel:
+                self._parallel_keys.add(key)
+            else:
+                self._parallel_keys.discard(key)
             return func
 
         return decorator
@@ -78,31 +189,34 @@ class Context:
         if namespace in self._namespace_handlers:
             raise ValueError(f"Namespace '{namespace}' is already registered")
         self._namespace_handlers[namespace] = handler
-        self._namespace_metadata[namespace] = dict(metadata) if isinstance(metadata, Dict) else {}
+        self._namespace_metadata[namespace] = dict(metadata) if isinstance(metadata, dict) else {}
         return handler
 
     def _resolve_namespace_handler(self, namespace: str):
         handler = self._namespace_handlers.get(namespace)
         if handler is not None:
             return handler
+        bridge = _bridge()
+        if bridge is None:
+            return None
         try:
-            from .busy_bridge import get_namespace
-
-            return get_namespace(namespace)
-        except Exception:
+            return bridge.get_namespace(namespace)
+        except ValueError:
+            # Invalid identifiers cannot name a bridge namespace.
             return None
 
     def _resolve_namespace_metadata(self, namespace: str) -> Dict[str, Any]:
         local_metadata = self._namespace_metadata.get(namespace)
-        local_payload = dict(local_metadata) if isinstance(local_metadata, Dict) else {}
-        try:
-            from .busy_bridge import get_namespace_metadata
-
-            bridge_metadata = get_namespace_metadata(namespace)
-            local_payload.update(bridge_metadata or {})
+        local_payload = dict(local_metadata) if isinstance(local_metadata, dict) else {}
+        bridge = _bridge()
+        if bridge is None:
             return local_payload
-        except Exception:
+        try:
+            bridge_metadata = bridge.get_namespace_metadata(namespace)
+        except ValueError:
             return local_payload
+        local_payload.update(bridge_metadata or {})
+        return local_payload
 
     def get_no_response(self, namespace: str, action: str) -> bool:
         metadata = self._resolve_namespace_metadata(namespace)
@@ -116,24 +230,26 @@ class Context:
 
     @staticmethod
     def _extract_action_metadata(metadata: Dict[str, Any], action: str) -> Dict[str, Any]:
+        # Returns the stored mapping itself; callers only read from it.
         if not metadata:
             return {}
         action_name = str(action or "").strip()
         action_name_lc = action_name.lower()
-        for container_name in ("actions", "action_metadata", "action_metadata_by_name"):
+        for container_name in _META_ACTION_CONTAINERS:
             actions = metadata.get(container_name)
-            if not isinstance(actions, Dict):
+            if not isinstance(actions, dict):
                 continue
-            if action_name in actions and isinstance(actions[action_name], Dict):
-                return dict(actions[action_name])
-            if action_name_lc in actions and isinstance(actions[action_name_lc], Dict):
-                return dict(actions[action_name_lc])
+            data = actions.get(action_name)
+            if isinstance(data, dict):
+                return data
+            data = actions.get(action_name_lc)
+            if isinstance(data, dict):
+                return data
         return {}
 
     def unregister_namespace(self, namespace: str) -> None:
-        if namespace not in self._namespace_handlers:
+        if self._namespace_handlers.pop(namespace, _MISSING) is _MISSING:
             raise KeyError(f"Namespace '{namespace}' is not registered")
-        del self._namespace_handlers[namespace]
         self._namespace_metadata.pop(namespace, None)
 
     def execute_cheatcode(self, namespace: str, action: str, attributes: Optional[Dict[str, Any]] = None):
@@ -147,7 +263,7 @@ class Context:
         attrs = dict(attributes or {})
         for key in attrs:
             _validate_identifier(key)
-        return handler.execute(action, **_freeze_kwargs(attrs))
+        return handler.execute(action, **attrs)
 
     def register_container(self, tag_name: str):
         _validate_identifier(tag_name)
@@ -159,142 +275,184 @@ class Context:
         return decorator
 
     def execute_text(self, text: str, **kwargs) -> List[Any]:
-        tags = parse_all(text)
-        results = []
-        for tag in tags:
+        tags = _parse_all(text)
+        execute_tag = self.execute_tag
+        results: List[Any] = [None] * len(tags)
+        for index, tag in enumerate(tags):
             try:
-                results.append(self.execute_tag(tag, **kwargs))
+                results[index] = execute_tag(tag, **kwargs)
             except Exception as exc:
-                results.append({"error": str(exc), "tag": tag.raw})
+                results[index] = {"error": str(exc), "tag": tag.raw}
         return results
 
+    def iter_execute_text(self, text: str, **kwargs) -> Iterator[Any]:
+        """Lazy `execute_text`: yield each tag's result as it is executed.
+
+        Tags after the last one consumed are never executed, so stopping early
+        skips their handlers and side effects.
+        """
+        execute_tag = self.execute_tag
+        for tag in _parse_all(text):
+            try:
+                result = execute_tag(tag, **kwargs)
+            except Exception as exc:
+                result = {"error": str(exc), "tag": tag.raw}
+            yield result
+
     def execute(self, tag_string: str, **kwargs) -> Any:
-        tag = parse_tag(tag_string)
+        tag = _parse_tag(tag_string)
         return self.execute_tag(tag, **kwargs)
 
     def execute_tag(self, tag: Tag, **kwargs) -> Any:
         _validate_tag_values(tag)
-        safe_kwargs = _freeze_kwargs(kwargs)
-        self.hooks.do_action("before_execute", tag, **safe_kwargs)
-        if tag.tag_type == TagType.DOUBLE:
-            result = self._execute_container(tag, **kwargs)
-        elif tag.tag_type == TagType.CHEATCODE:
-            result = self._execute_cheatcode(tag, **kwargs)
-        else:
-            result = self._execute_simple(tag, **kwargs)
-        if self._apply_filters:
+        hooks = self.hooks
+        # **kwargs is already a fresh dict owned by this call, and every
+        # downstream call splats it again, so no defensive copy is needed.
+        safe_kwargs = kwargs
+        # Most contexts register no hooks or filters; a presence check skips
+        # the dispatch call and argument freezing for those points.
+        if hooks.has_action("before_execute"):
+            hooks.do_action("before_execute", tag, **safe_kwargs)
+        result = self._tag_dispatch.get(tag.tag_type, self._execute_simple)(tag, **kwargs)
+        if self._apply_filters and self.filters.has_filter("result"):
             result = self.filters.apply_filters("result", result, tag, **safe_kwargs)
-        self.hooks.do_action("after_execute", tag, result, **safe_kwargs)
+        if hooks.has_action("after_execute"):
+            hooks.do_action("after_execute", tag, result, **safe_kwargs)
         return result
 
     def _execute_container(self, tag: Tag, **kwargs) -> Any:
+        handler, args, call_kwargs = self._resolve_container(tag, kwargs)
+        return handler(*args, **call_kwargs)
+
+    def _execute_cheatcode(self, tag: Tag, **kwargs) -> Any:
+        safe_kwargs = kwargs
+        bridge = _bridge()
+        self._emit_cheatcode(bridge, _PRE_CHEATCODE_POINT, tag, tag.attributes, safe_kwargs)
+        handler, args, call_kwargs = self._resolve_cheatcode(tag, safe_kwargs)
+        result = handler(*args, **call_kwargs)
+        self._emit_cheatcode(bridge, _POST_CHEATCODE_POINT, tag, result, safe_kwargs)
+        return result
+
+    def _execute_simple(self, tag: Tag, **kwargs) -> Any:
+        handler, args, call_kwargs = self._resolve_simple(tag, kwargs)
+        return handler(*args, **call_kwargs)
+
+    # Handler resolution shared by the sync and async paths. Each returns
+    # (handler, args, kwargs) for the call; calling (and awaiting) is left to
+    # the caller so both paths apply identical lookup and validation.
+
+    def _resolve_container(self, tag: Tag, safe_kwargs: Dict[str, Any]):
         handler = self._container_handlers.get(tag.action)
         if not handler:
             raise ValueError(f"No container handler for '{tag.action}'")
-        return handler(tag.content, **_freeze_kwargs(kwargs))
-
-    def _execute_cheatcode(self, tag: Tag, **kwargs) -> Any:
-        key = f"{tag.namespace}:{tag.action}"
-        local_handler = self._handlers.get(key)
+        return handler, (tag.content,), safe_kwargs
+
+    def _resolve_cheatcode(self, tag: Tag, safe_kwargs: Dict[str, Any]):
+        # Only local handlers are looked up by key; namespace handlers and
+        # their allow-lists are resolved on every call so an unregister or
+        # policy change takes effect immediately.
+        local_handler = self._handlers.get(tag.key)
+        if local_handler is not None:
+            return local_handler, tag.params, _merge_call_kwargs(tag.attributes, safe_kwargs)
+        namespace = str(tag.namespace)
+        ns_handler = self._resolve_namespace_handler(namespace)
+        if ns_handler is None:
+            raise ValueError(f"No handler for cheatcode '{tag.key}'")
+        if not hasattr(ns_handler, "execute"):
+            raise ValueError(f"Namespace handler for '{namespace}' has no execute() method")
+        bridge = _bridge()
+        if bridge is None:
+            raise RuntimeError("busy_bridge is unavailable; namespace action metadata cannot be validated")
+        bridge.validate_action_metadata(namespace, tag.action, self._resolve_namespace_metadata(namespace))
+        return ns_handler.execute, (tag.action,), _merge_call_kwargs(tag.attributes, safe_kwargs)
+
+    def _resolve_simple(self, tag: Tag, safe_kwargs: Dict[str, Any]):
+        handler = self._handlers.get(tag.key)
+        if not handler:
+            raise ValueError(f"No handler for tag '{tag.action}'")
+        return handler, (), safe_kwargs
 
-        safe_kwargs = _freeze_kwargs(kwargs)
+    @staticmethod
+    def _emit_cheatcode(bridge: Any, point: Optional[str], tag: Tag, payload: Any, safe_kwargs: Dict[str, Any]) -> None:
+        # `bridge` is the caller's _bridge() result, which also set the point
+        # constants. emit() already isolates subscriber exceptions; anything
+        # else raised here is a bridge fault and must surface.
+        if bridge is None:
+            return
+        # Subscribers receive a frozen copy of the context, so it is only
+        # built when someone is listening.
+        if not bridge.busy38_hooks.has_action(point):
+            return
         call_context = {"tag": tag, "namespace": tag.namespace, "action": tag.action}
         call_context.update(safe_kwargs)
+        bridge.emit(point, tag.namespace, tag.action, payload, context=call_context)
 
-        try:
-            from .busy_bridge import emit as emit_compat, HookPoints
-
-            emit_compat(
-                HookPoints.PRE_CHEATCODE_EXECUTE,
-                tag.namespace,
-                tag.action,
-                tag.attributes,
-                context=call_context,
-            )
-        except Exception:
-            pass
-
-        if local_handler is None:
-            namespace = str(tag.namespace)
-            ns_handler = self._resolve_namespace_handler(namespace)
-            if ns_handler is None:
-                raise ValueError(f"No handler for cheatcode '{key}'")
-            if not hasattr(ns_handler, "execute"):
-                raise ValueError(f"Namespace handler for '{namespace}' has no execute() method")
-            from .busy_bridge import validate_action_metadata
-
-            validate_action_metadata(namespace, tag.action, self._resolve_namespace_metadata(namespace))
-            result = ns_handler.execute(tag.action, **_merge_call_kwargs(tag.attributes, safe_kwargs))
-        else:
-            args = tag.params.copy()
-            result = local_handler(*args, **_merge_call_kwargs(tag.attributes, safe_kwargs))
+    async def execute_async(self, tag_string: str, **kwargs) -> Any:
+        return await self.execute_tag_async(_parse_tag(tag_string), **kwargs)
 
-        try:
-            from .busy_bridge import emit as emit_compat, HookPoints
-
-            emit_compat(
-                HookPoints.POST_CHEATCODE_EXECUTE,
-                tag.namespace,
-                tag.action,
-                result,
-                context=call_context,
-            )
-        except Exception:
-            pass
+    async def execute_text_async(self, text: str, **kwargs) -> List[Any]:
+        """Async `execute_text`: same per-tag results and error capture.
 
-        return result
+        Tags run in document order, except that a run of adjacent tags whose
+        handlers were registered with `parallel=True` is awaited concurrently.
+        Any other tag is a barrier: it starts only after the run before it has
+        finished. Results keep document order either way.
+        """
+        tags = _parse_all(text)
+        results: List[Any] = [None] * len(tags)
 
-    def _execute_simple(self, tag: Tag, **kwargs) -> Any:
-        handler = self._handlers.get(tag.action)
-        if not handler:
-            raise ValueError(f"No handler for tag '{tag.action}'")
-        return handler(**_freeze_kwargs(kwargs))
+        async def run(index: int, tag: Tag) -> None:
+            try:
+                results[index] = await self.execute_tag_async(tag, **kwargs)
+            except Exception as exc:
+                results[index] = {"error": str(exc), "tag": tag.raw}
 
-    async def execute_async(self, tag_string: str, **kwargs) -> Any:
-        tag = parse_tag(tag_string)
-        safe_kwargs = _freeze_kwargs(kwargs)
-        self.hooks.do_action("before_execute", tag, **safe_kwargs)
-
-        if tag.tag_type == TagType.DOUBLE:
-            handler = self._container_handlers.get(tag.action)
-            if not handler:
-                raise ValueError(f"No handler for '{tag.action}'")
-            result = handler(tag.content, **safe_kwargs)
-        elif tag.tag_type == TagType.CHEATCODE:
-            key = f"{tag.namespace}:{tag.action}"
-            handler = self._handlers.get(key)
-            if handler is None:
-                ns_handler = self._resolve_namespace_handler(str(tag.namespace))
-                if ns_handler is None:
-                    raise ValueError(f"No handler for '{tag.namespace}:{tag.action}'")
-                if not hasattr(ns_handler, "execute"):
-                    raise ValueError(f"Namespace handler for '{tag.namespace}' has no execute() method")
-                metadata = self._resolve_namespace_metadata(str(tag.namespace))
-                from .busy_bridge import validate_action_metadata
-
-                validate_action_metadata(str(tag.namespace), tag.action, metadata)
-                result = ns_handler.execute(tag.action, **_merge_call_kwargs(tag.attributes, safe_kwargs))
-            else:
-                result = handler(*tag.params, **_merge_call_kwargs(tag.attributes, safe_kwargs))
+        batch: List[Any] = []
+        for index, tag in enumerate(tags):
+            if tag.tag_type != TagType.DOUBLE and tag.key in self._parallel_keys:
+                batch.append(run(index, tag))
+                continue
+            if batch:
+                await asyncio.gather(*batch)
+                batch = []
+            await run(index, tag)
+        if batch:
+            await asyncio.gather(*batch)
+        return results
+
+    async def execute_tag_async(self, tag: Tag, **kwargs) -> Any:
+        _validate_tag_values(tag)
+        safe_kwargs = kwargs
+        if self.hooks.has_action("before_execute"):
+            self.hooks.do_action("before_execute", tag, **safe_kwargs)
+
+        is_cheatcode = tag.tag_type == TagType.CHEATCODE
+        if is_cheatcode:
+            bridge = _bridge()
+            self._emit_cheatcode(bridge, _PRE_CHEATCODE_POINT, tag, tag.attributes, safe_kwargs)
+            handler, args, call_kwargs = self._resolve_cheatcode(tag, safe_kwargs)
+        elif tag.tag_type == TagType.DOUBLE:
+            handler, args, call_kwargs = self._resolve_container(tag, safe_kwargs)
         else:
-            handler = self._handlers.get(tag.action)
-            if not handler:
-                raise ValueError(f"No handler for '{tag.action}'")
-            result = handler(**safe_kwargs)
+            handler, args, call_kwargs = self._resolve_simple(tag, safe_kwargs)
 
+        result = handler(*args, **call_kwargs)
         if inspect.isawaitable(result):
             result = await result
-        if self._apply_filters:
+        if is_cheatcode:
+            self._emit_cheatcode(bridge, _POST_CHEATCODE_POINT, tag, result, safe_kwargs)
+        if self._apply_filters and self.filters.has_filter("result"):
             result = self.filters.apply_filters("result", result, tag, **safe_kwargs)
-        self.hooks.do_action("after_execute", tag, result, **safe_kwargs)
+        if self.hooks.has_action("after_execute"):
+            self.hooks.do_action("after_execute", tag, result, **safe_kwargs)
         return result
 
 
 _global_context = Context()
 
 
-def register(pattern: str):
-    return _global_context.register(pattern)
+def register(pattern: str, parallel: bool = False):
+    return _global_context.register(pattern, parallel=parallel)
 
 
 def register_container(tag_name: str):
@@ -302,7 +460,11 @@ def register_container(tag_name: str):
 
 
 def execute(tag_string: str, **kwargs) -> Any:
-    tag = parse_tag(tag_string)
+    tag = _parse_tag(tag_string)
+    return _global_context.execute_tag(tag, **kwargs)
+
+
+def execute_tag(tag: Tag, **kwargs) -> Any:
     return _global_context.execute_tag(tag, **kwargs)
 
 
@@ -310,32 +472,32 @@ def execute_text(text: str, **kwargs) -> List[Any]:
     return _global_context.execute_text(text, **kwargs)
 
 
-def register_namespace(namespace: str, handler: Any, metadata: Optional[Dict[str, Any]] = None):
-    try:
-        from .busy_bridge import register_namespace as register_bridge_namespace
+def iter_execute_text(text: str, **kwargs) -> Iterator[Any]:
+    return _global_context.iter_execute_text(text, **kwargs)
+
 
-        register_bridge_namespace(namespace, handler, metadata=metadata)
-    except (ImportError, ModuleNotFoundError):
+def register_namespace(namespace: str, handler: Any, metadata: Optional[Dict[str, Any]] = None):
+    bridge = _bridge()
+    if bridge is None:
         _global_context.register_namespace(namespace, handler, metadata=metadata)
+    else:
+        bridge.register_namespace(namespace, handler, metadata=metadata)
     return handler
 
 
 def unregister_namespace(namespace: str) -> None:
-    try:
-        from .busy_bridge import unregister_namespace as unregister_bridge_namespace
-
-        unregister_bridge_namespace(namespace)
-    except (ImportError, ModuleNotFoundError):
+    bridge = _bridge()
+    if bridge is None:
         _global_context.unregister_namespace(namespace)
+    else:
+        bridge.unregister_namespace(namespace)
 
 
 def execute_cheatcode(namespace: str, action: str, attributes: Optional[Dict[str, Any]] = None):
-    try:
-        from .busy_bridge import execute_cheatcode as execute_bridge_cheatcode
-
-        return execute_bridge_cheatcode(namespace, action, attributes)
-    except (ImportError, ModuleNotFoundError):
+    bridge = _bridge()
+    if bridge is None:
         return _global_context.execute_cheatcode(namespace, action, attributes)
+    return bridge.execute_cheatcode(namespace, action, attributes)
 
 
 def get_no_response(namespace: str, action: str) -> bool:
@@ -344,3 +506,11 @@ def get_no_response(namespace: str, action: str) -> bool:
 
 async def execute_async(tag_string: str, **kwargs) -> Any:
     return await _global_context.execute_async(tag_string, **kwargs)
+
+
+async def execute_tag_async(tag: Tag, **kwargs) -> Any:
+    return await _global_context.execute_tag_async(tag, **kwargs)
+
+
+async def execute_text_async(text: str, **kwargs) -> List[Any]:
+    return await _global_context.execute_text_async(text, **kwargs)
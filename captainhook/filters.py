@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import bisect
+import itertools
+import sys
 from types import MappingProxyType
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# Exact types that are already immutable pass through _freeze untouched; most
+# hook arguments are names, ids and flags, so this skips the isinstance chain.
+_IMMUTABLE_TYPES = frozenset({str, bytes, int, float, bool, type(None), tuple, frozenset, MappingProxyType})
 
 
 def _freeze(value: Any) -> Any:
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
     if isinstance(value, dict):
         return MappingProxyType(dict(value))
     if isinstance(value, list):
@@ -19,19 +28,60 @@ def _freeze(value: Any) -> Any:
     return value
 
 
-@dataclass(frozen=True)
+def _view(value: Any) -> Any:
+    # Non-strict freeze: dicts are wrapped read-only without copying, so the
+    # callback sees the caller's live mapping. Other types as in _freeze.
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    return _freeze(value)
+
+
 class _FilterRegistration:
-    callback: Callable
-    priority: int
+    # Slotted, never mutated after construction. Ordering is (priority,
+    # order): `order` is a per-Filters insertion counter, so bisect keeps
+    # equal priorities FIFO without comparing callbacks.
+    __slots__ = ("priority", "order", "callback", "on_error")
+
+    def __init__(self, priority: int, order: int, callback: Callable, on_error: Optional[Callable]) -> None:
+        self.priority = priority
+        self.order = order
+        self.callback = callback
+        self.on_error = on_error
+
+    def __lt__(self, other: "_FilterRegistration") -> bool:
+        return (self.priority, self.order) < (other.priority, other.order)
 
 
 class Filters:
     """Filters system - WordPress-style filter hooks."""
 
-    def __init__(self) -> None:
-        self._filters: Dict[str, List[_FilterRegistration]] = {}
-
-    def add_filter(self, tag: str, callback: Callable, priority: int = 10):
+    __slots__ = ("_filters", "_callbacks", "_order", "_freeze")
+
+    def __init__(self, strict: bool = False) -> None:
+        # strict=True copies dict arguments before wrapping them read-only, so
+        # callbacks never observe later changes to the caller's mapping.
+        self._freeze = _freeze if strict else _view
+        # Buckets are immutable tuples replaced on every change, so dispatch
+        # iterates the stored bucket directly without copying it.
+        self._filters: Dict[str, Tuple[_FilterRegistration, ...]] = {}
+        # Dispatch view of each bucket as (callback, on_error) pairs, kept in
+        # step by _store; see Hooks.
+        self._callbacks: Dict[str, Tuple[Tuple[Callable, Optional[Callable]], ...]] = {}
+        self._order = itertools.count()
+
+    def _store(self, tag: str, bucket: Tuple[_FilterRegistration, ...]) -> None:
+        if bucket:
+            self._filters[tag] = bucket
+            self._callbacks[tag] = tuple((f.callback, f.on_error) for f in bucket)
+        else:
+            del self._filters[tag]
+            del self._callbacks[tag]
+
+    def add_filter(
+        self, tag: str, callback: Callable, priority: int = 10, on_error: Optional[Callable[[Exception], Any]] = None
+    ):
         """
         Add a filter.
 
@@ -39,9 +89,16 @@ class Filters:
             tag: Filter name
             callback: Callback to execute (should accept and return value)
             priority: Lower = earlier execution (default: 10)
+            on_error: Called with the exception if `callback` raises; the
+                value passes through unchanged and later filters still run.
+                Without it, the exception propagates to the caller.
         """
-        self._filters.setdefault(tag, []).append(_FilterRegistration(callback=callback, priority=priority))
-        self._filters[tag].sort(key=lambda item: item.priority)
+        if type(tag) is str:
+            tag = sys.intern(tag)
+        entry = _FilterRegistration(priority=priority, order=next(self._order), callback=callback, on_error=on_error)
+        bucket = self._filters.get(tag, ())
+        index = bisect.bisect_right(bucket, entry)
+        self._store(tag, bucket[:index] + (entry,) + bucket[index:])
 
     def apply_filters(self, tag: str, value: Any, *args, **kwargs) -> Any:
         """
@@ -56,27 +113,35 @@ class Filters:
         Returns:
             Filtered value
         """
-        callbacks = list(self._filters.get(tag, []))
+        callbacks = self._callbacks.get(tag)
         if not callbacks:
             return value
 
-        safe_args = tuple(_freeze(value) for value in args)
-        safe_kwargs: Dict[str, Any] = {key: _freeze(value) for key, value in kwargs.items()}
-        current = _freeze(value)
-        for filter_registration in callbacks:
-            try:
-                current = filter_registration.callback(current, *safe_args, **safe_kwargs)
-            except Exception:
+        # Most dispatches pass no extra arguments; skip the freeze passes then.
+        freeze = self._freeze
+        safe_args = tuple(map(freeze, args)) if args else ()
+        safe_kwargs: Dict[str, Any] = {key: freeze(value) for key, value in kwargs.items()} if kwargs else kwargs
+        current = freeze(value)
+        for callback, on_error in callbacks:
+            if on_error is None:
+                current = callback(current, *safe_args, **safe_kwargs)
                 continue
+            try:
+                current = callback(current, *safe_args, **safe_kwargs)
+            except Exception as exc:
+                on_error(exc)
         return current
 
     def remove_filter(self, tag: str, callback: Callable):
-        """Remove a specific filter."""
+        """Remove a specific filter. Callbacks are matched by identity, as in Hooks.remove_action."""
         callbacks = self._filters.get(tag)
         if not callbacks:
             return
-        self._filters[tag] = [f for f in callbacks if f.callback is not callback]
+        remaining = tuple(f for f in callbacks if f.callback is not callback)
+        if len(remaining) != len(callbacks):
+            self._store(tag, remaining)
 
     def has_filter(self, tag: str) -> bool:
         """Check if a filter exists."""
-        return tag in self._filters and len(self._filters[tag]) > 0
+        # Empty buckets are dropped on removal, so presence means subscribers.
+        return tag in self._filters
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import bisect
+import sys
 from dataclasses import dataclass
 from types import MappingProxyType
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+# Exact types that are already immutable pass through _freeze untouched; most
+# hook arguments are names, ids and flags, so this skips the isinstance chain.
+_IMMUTABLE_TYPES = frozenset({str, bytes, int, float, bool, type(None), tuple, frozenset, MappingProxyType})
 
 
 def _freeze(value: Any) -> Any:
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
     if isinstance(value, dict):
         return MappingProxyType(dict(value))
     if isinstance(value, list):
@@ -19,20 +28,60 @@ def _freeze(value: Any) -> Any:
     return value
 
 
+def _view(value: Any) -> Any:
+    # Non-strict freeze: dicts are wrapped read-only without copying, so the
+    # callback sees the caller's live mapping. Other types as in _freeze.
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType(value)
+    return _freeze(value)
+
+
 @dataclass(frozen=True)
 class _HookRegistration:
+    # Manual slots (dataclass(slots=True) needs 3.10); no per-entry __dict__.
+    __slots__ = ("callback", "priority", "action", "on_error")
+
     callback: Callable
     priority: int
     action: str
+    on_error: Optional[Callable]
+
+    def __lt__(self, other: "_HookRegistration") -> bool:
+        # Priority only: bisect_right then lands after every equal-priority
+        # entry, which keeps registration (FIFO) order within a priority.
+        return self.priority < other.priority
 
 
 class Hooks:
     """WordPress-style action hooks."""
 
-    def __init__(self) -> None:
-        self._hooks: Dict[str, List[_HookRegistration]] = {}
-
-    def add_action(self, hook_name: str, callback: Callable, priority: int = 10):
+    __slots__ = ("_hooks", "_callbacks", "_freeze")
+
+    def __init__(self, strict: bool = False) -> None:
+        # strict=True copies dict arguments before wrapping them read-only, so
+        # callbacks never observe later changes to the caller's mapping.
+        self._freeze = _freeze if strict else _view
+        # Buckets are immutable tuples replaced on every change, so dispatch
+        # iterates the stored bucket directly without copying it.
+        self._hooks: Dict[str, Tuple[_HookRegistration, ...]] = {}
+        # Dispatch view of each bucket as (callback, on_error) pairs, kept in
+        # step by _store, so do_action unpacks plain tuples rather than
+        # reading attributes off every registration.
+        self._callbacks: Dict[str, Tuple[Tuple[Callable, Optional[Callable]], ...]] = {}
+
+    def _store(self, hook_name: str, bucket: Tuple[_HookRegistration, ...]) -> None:
+        if bucket:
+            self._hooks[hook_name] = bucket
+            self._callbacks[hook_name] = tuple((h.callback, h.on_error) for h in bucket)
+        else:
+            del self._hooks[hook_name]
+            del self._callbacks[hook_name]
+
+    def add_action(
+        self, hook_name: str, callback: Callable, priority: int = 10, on_error: Optional[Callable[[Exception], Any]] = None
+    ):
         """
         Add an action hook.
 
@@ -40,10 +89,15 @@ class Hooks:
             hook_name: Name of the hook
             callback: Function to call
             priority: Lower = earlier execution (default: 10)
+            on_error: Called with the exception if `callback` raises; later
+                callbacks still run. Without it, the exception propagates.
         """
-        entry = _HookRegistration(callback=callback, priority=priority, action=hook_name)
-        self._hooks.setdefault(hook_name, []).append(entry)
-        self._hooks[hook_name].sort(key=lambda item: item.priority)
+        if type(hook_name) is str:
+            hook_name = sys.intern(hook_name)
+        entry = _HookRegistration(callback=callback, priority=priority, action=hook_name, on_error=on_error)
+        bucket = self._hooks.get(hook_name, ())
+        index = bisect.bisect_right(bucket, entry)
+        self._store(hook_name, bucket[:index] + (entry,) + bucket[index:])
 
     def do_action(self, hook_name: str, *args, **kwargs):
         """
@@ -54,25 +108,39 @@ class Hooks:
             *args: Positional arguments to pass to callbacks
             **kwargs: Keyword arguments to pass to callbacks
         """
-        callbacks = list(self._hooks.get(hook_name, []))
+        callbacks = self._callbacks.get(hook_name)
         if not callbacks:
             return
 
-        safe_args = tuple(_freeze(value) for value in args)
-        safe_kwargs: Dict[str, Any] = {key: _freeze(value) for key, value in kwargs.items()}
-        for hook in callbacks:
-            try:
-                hook.callback(*safe_args, **safe_kwargs)
-            except Exception:
+        # Most dispatches pass no extra arguments; skip the freeze passes then.
+        freeze = self._freeze
+        safe_args = tuple(map(freeze, args)) if args else ()
+        safe_kwargs: Dict[str, Any] = {key: freeze(value) for key, value in kwargs.items()} if kwargs else kwargs
+        for callback, on_error in callbacks:
+            if on_error is None:
+                callback(*safe_args, **safe_kwargs)
                 continue
+            try:
+                callback(*safe_args, **safe_kwargs)
+            except Exception as exc:
+                on_error(exc)
 
     def remove_action(self, hook_name: str, callback: Callable):
-        """Remove a specific action."""
+        """
+        Remove a specific action.
+
+        Callbacks are matched by identity, never `==`, so user `__eq__` is not
+        invoked. Pass the object that was registered: `obj.method` creates a
+        new bound method on each access, so keep a reference to it.
+        """
         hooks = self._hooks.get(hook_name)
         if not hooks:
             return
-        self._hooks[hook_name] = [h for h in hooks if h.callback is not callback]
+        remaining = tuple(h for h in hooks if h.callback is not callback)
+        if len(remaining) != len(hooks):
+            self._store(hook_name, remaining)
 
     def has_action(self, hook_name: str) -> bool:
         """Check if a hook has any actions."""
-        return hook_name in self._hooks and len(self._hooks[hook_name]) > 0
+        # Empty buckets are dropped on removal, so presence means subscribers.
+        return hook_name in self._hooks
@@ -7,10 +7,10 @@ Malformed markup fails closed via ParseError.
 
 from __future__ import annotations
 
-import shlex
+import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class TagType(Enum):
@@ -29,6 +29,9 @@ class ParseError(ValueError):
 class Tag:
     """Represents a parsed tag."""
 
+    # Manual slots (dataclass(slots=True) needs 3.10).
+    __slots__ = ("tag_type", "namespace", "action", "params", "attributes", "content", "raw")
+
     tag_type: TagType
     namespace: Optional[str]
     action: str
@@ -37,6 +40,23 @@ class Tag:
     content: Optional[str]
     raw: str
 
+    @property
+    def key(self) -> str:
+        """Handler lookup key ("ns:action" or "action").
+
+        Derived from the live fields on every access: before_execute hooks
+        may rewrite `namespace`/`action`, and dispatch must act on the same
+        action that validation and metadata checks see.
+        """
+        return f"{self.namespace}:{self.action}" if self.namespace else self.action
+
+
+# Character classes as compiled matches. For str patterns, \w is exactly
+# str.isalnum() plus "_" and \s is exactly str.isspace() (checked over every
+# code point), so these replace the per-character Python loops one for one.
+_IDENTIFIER_TAIL = re.compile(r"[\w-]*")
+_WHITESPACE = re.compile(r"\s*")
+
 
 def _read_identifier(text: str, start: int) -> Tuple[Optional[str], int]:
     if start >= len(text):
@@ -44,19 +64,90 @@ def _read_identifier(text: str, start: int) -> Tuple[Optional[str], int]:
     if not (text[start].isalpha() or text[start] == "_"):
         return None, start
 
-    end = start + 1
-    while end < len(text) and (text[end].isalnum() or text[end] in {"_", "-"}):
-        end += 1
+    # Not interned: names here come from untrusted text, and interned strings
+    # are never freed on some CPython versions. Registration keys are interned
+    # instead, and dict lookups still work on equal, non-interned strings.
+    end = _IDENTIFIER_TAIL.match(text, start + 1).end()
     return text[start:end], end
 
 
+# Tokenizer characters, matching shlex.split(posix=True): whitespace separates
+# tokens, quotes and backslash change how the following text is read.
+_ARG_WHITESPACE = frozenset(" \t\r\n")
+_ARG_SPECIAL = frozenset(" \t\r\n\\'\"")
+_ARG_QUOTING = re.compile(r"[\\'\"]")
+_ARG_PLAIN_TOKEN = re.compile(r"[^ \t\r\n]+")
+
+
+def _split_args(arg_text: str, base_offset: int) -> List[str]:
+    """
+    Split argument text with POSIX shell quoting, as shlex.split(posix=True).
+
+    Backslash escapes any character outside quotes; single quotes are literal;
+    inside double quotes backslash escapes only '"' and '\\'. Adjacent quoted
+    and unquoted pieces join into one token, and '' or "" is an empty token.
+    """
+    # Unquoted argument text (the common case) is plain whitespace splitting,
+    # done in one compiled pass; only quoting needs the state machine below.
+    if _ARG_QUOTING.search(arg_text) is None:
+        return _ARG_PLAIN_TOKEN.findall(arg_text)
+    tokens: List[str] = []
+    buf: List[str] = []
+    in_token = False
+    i = 0
+    n = len(arg_text)
+    while i < n:
+        ch = arg_text[i]
+        if ch in _ARG_WHITESPACE:
+            if in_token:
+                tokens.append("".join(buf))
+                buf = []
+                in_token = False
+            i += 1
+            continue
+        in_token = True
+        if ch == "\\":
+            if i + 1 >= n:
+                raise ParseError(f"Malformed argument quoting near index {base_offset}: No escaped character")
+            buf.append(arg_text[i + 1])
+            i += 2
+        elif ch == "'":
+            end = arg_text.find("'", i + 1)
+            if end < 0:
+                raise ParseError(f"Malformed argument quoting near index {base_offset}: No closing quotation")
+            buf.append(arg_text[i + 1 : end])
+            i = end + 1
+        elif ch == '"':
+            i += 1
+            while True:
+                if i >= n:
+                    raise ParseError(f"Malformed argument quoting near index {base_offset}: No closing quotation")
+                ch = arg_text[i]
+                if ch == '"':
+                    i += 1
+                    break
+                if ch == "\\" and i + 1 < n and arg_text[i + 1] in '"\\':
+                    buf.append(arg_text[i + 1])
+                    i += 2
+                    continue
+                buf.append(ch)
+                i += 1
+        else:
+            # Plain run: copy up to the next whitespace, quote or backslash.
+            end = i + 1
+            while end < n and arg_text[end] not in _ARG_SPECIAL:
+                end += 1
+            buf.append(arg_text[i:end])
+            i = end
+    if in_token:
+        tokens.append("".join(buf))
+    return tokens
+
+
 def _parse_arg_tokens(arg_text: str, base_offset: int = 0) -> Tuple[Dict[str, str], List[str]]:
     if not arg_text:
         return {}, []
-    try:
-        tokens = shlex.split(arg_text, posix=True)
-    except ValueError as exc:
-        raise ParseError(f"Malformed argument quoting near index {base_offset}: {exc}") from exc
+    tokens = _split_args(arg_text, base_offset)
 
     attributes: Dict[str, str] = {}
     params: List[str] = []
@@ -74,40 +165,59 @@ def _parse_arg_tokens(arg_text: str, base_offset: int = 0) -> Tuple[Dict[str, st
     return attributes, params
 
 
+# Characters that change _find_cheatcode_close's state, outside and inside a
+# quoted value. The scanner jumps between them with re.search instead of
+# stepping through every character in Python.
+_CLOSE_SCAN = re.compile(r"[\\'\"/]")
+_QUOTE_SCAN = {"'": re.compile(r"[\\']"), '"': re.compile(r'[\\"]')}
+
+
 def _find_cheatcode_close(text: str, start: int) -> int:
     """
     Find the start of a closing ` /]` sequence for a cheatcode, honoring quotes.
     Returns index of '/' or raises ParseError.
     """
+    # The final character can only be the ']' of a close, so it is never a
+    # scan position (endpos); a backslash skips the character after it.
+    endpos = len(text) - 1
     i = start
-    quote: Optional[str] = None
-    escaped = False
-    while i < len(text) - 1:
+    while True:
+        match = _CLOSE_SCAN.search(text, i, endpos)
+        if match is None:
+            raise ParseError("Malformed cheatcode: missing '/]'")
+        i = match.start()
         ch = text[i]
-        if escaped:
-            escaped = False
-            i += 1
-            continue
         if ch == "\\":
-            escaped = True
+            i += 2
+        elif ch == "/":
+            if text[i + 1] == "]":
+                return i
             i += 1
-            continue
-        if quote is not None:
-            if ch == quote:
-                quote = None
-            i += 1
-            continue
-        if ch in {'"', "'"}:
-            quote = ch
+        else:
+            quote_scan = _QUOTE_SCAN[ch].search
             i += 1
-            continue
-        if ch == "/" and text[i + 1] == "]":
-            return i
-        i += 1
-    raise ParseError("Malformed cheatcode: missing '/]'")
-
-
-def _read_tag_token(text: str, start: int) -> Tuple[Optional[Dict[str, Any]], int]:
+            while True:
+                match = quote_scan(text, i, endpos)
+                if match is None:
+                    raise ParseError("Malformed cheatcode: missing '/]'")
+                i = match.start()
+                if text[i] == "\\":
+                    i += 2
+                    continue
+                i += 1
+                break
+
+
+# Token kinds returned by _read_tag_token. Tokens are plain tuples laid out as
+# (kind, name, raw, ...): OPEN adds content_start; CHEATCODE uses the action as
+# its name and adds (namespace, attributes, params).
+_KIND_OPEN = 0
+_KIND_CLOSE = 1
+_KIND_SINGLE = 2
+_KIND_CHEATCODE = 3
+
+
+def _read_tag_token(text: str, start: int) -> Tuple[Optional[Tuple[Any, ...]], int]:
     if start >= len(text) or text[start] != "[":
         return None, start
     if start + 1 >= len(text):
@@ -121,11 +231,7 @@ def _read_tag_token(text: str, start: int) -> Tuple[Optional[Dict[str, Any]], in
             raise ParseError(f"Invalid close tag at index {start}")
         if cursor >= len(text) or text[cursor] != "]":
             raise ParseError(f"Malformed close tag for '{name}' at index {start}")
-        return {
-            "kind": "close",
-            "name": name,
-            "raw": text[start : cursor + 1],
-        }, cursor + 1
+        return (_KIND_CLOSE, name, text[start : cursor + 1]), cursor + 1
 
     # Open, cheatcode, or malformed.
     cursor = start + 1
@@ -139,91 +245,90 @@ def _read_tag_token(text: str, start: int) -> Tuple[Optional[Dict[str, Any]], in
         action, cursor = _read_identifier(text, cursor)
         if not action:
             raise ParseError(f"Invalid cheatcode action at index {start}")
-        while cursor < len(text) and text[cursor].isspace():
-            cursor += 1
+        cursor = _WHITESPACE.match(text, cursor).end()
 
         close_at = _find_cheatcode_close(text, cursor)
         arg_text = text[cursor:close_at].strip()
         attrs, params = _parse_arg_tokens(arg_text, base_offset=cursor)
         raw = text[start : close_at + 2]
-        return {
-            "kind": "cheatcode",
-            "namespace": namespace,
-            "action": action,
-            "raw": raw,
-            "attributes": attrs,
-            "params": params,
-        }, close_at + 2
+        return (_KIND_CHEATCODE, action, raw, namespace, attrs, params), close_at + 2
 
     # Ignore any whitespace before closing.
-    while cursor < len(text) and text[cursor].isspace():
-        cursor += 1
+    cursor = _WHITESPACE.match(text, cursor).end()
     if cursor >= len(text):
         raise ParseError(f"Unterminated token at index {start}")
 
     if text[cursor] == "/":
         if cursor + 1 >= len(text) or text[cursor + 1] != "]":
             raise ParseError(f"Malformed self-closing tag '[{namespace}' at index {start}")
-        return {
-            "kind": "single",
-            "name": namespace,
-            "raw": text[start : cursor + 2],
-        }, cursor + 2
+        return (_KIND_SINGLE, namespace, text[start : cursor + 2]), cursor + 2
 
     if text[cursor] != "]":
         raise ParseError(f"Malformed token after '{namespace}' at index {start}")
-    return {
-        "kind": "open",
-        "name": namespace,
-        "content_start": cursor + 1,
-        "raw_start": start,
-        "raw": text[start : cursor + 1],
-    }, cursor + 1
+    return (_KIND_OPEN, namespace, text[start : cursor + 1], cursor + 1), cursor + 1
 
 
 def parse_all(text: str, include_nested: bool = False) -> List[Tag]:
     """Parse all tags from text in source order."""
-    tags: List[Tag] = []
-    container_stack: List[Dict[str, Any]] = []
+    return list(_iter_tags(text, include_nested, None))
+
+
+def iter_tags(text: str, include_nested: bool = False) -> Iterator[Tag]:
+    """
+    Yield tags from text in source order as they are parsed.
+
+    Malformed markup raises ParseError when the scan reaches it, after the
+    tags before it have been yielded. Use parse_all when the whole text must
+    be validated before any tag is acted on; the execute_* APIs do.
+    """
+    return _iter_tags(text, include_nested, None)
+
+
+def _iter_tags(text: str, include_nested: bool, spans: Optional[List[Tuple[int, int]]]) -> Iterator[Tag]:
+    # When `spans` is given, the (start, end) offsets of each yielded tag's
+    # raw text are appended to it in the same order.
+    # Open containers as (name, raw_start, content_start).
+    container_stack: List[Tuple[str, int, int]] = []
     cursor = 0
 
-    while cursor < len(text):
-        if text[cursor] != "[":
-            cursor += 1
-            continue
+    while True:
+        # Jump straight to the next candidate tag; prose between tags is
+        # skipped by str.find rather than one character per iteration.
+        cursor = text.find("[", cursor)
+        if cursor < 0:
+            break
 
         parsed, next_cursor = _read_tag_token(text, cursor)
         if parsed is None:
             cursor += 1
             continue
 
-        kind = parsed["kind"]
-        if kind == "open":
-            container_stack.append(parsed)
+        kind = parsed[0]
+        if kind == _KIND_OPEN:
+            container_stack.append((parsed[1], cursor, parsed[3]))
             cursor = next_cursor
             continue
 
-        if kind == "close":
+        if kind == _KIND_CLOSE:
+            name = parsed[1]
             if not container_stack:
-                raise ParseError(f"Unexpected close tag '[/{parsed['name']}]' at index {cursor}")
-            open_tag = container_stack.pop()
-            if parsed["name"] != open_tag["name"]:
-                raise ParseError(
-                    f"Unbalanced container. expected '[/{open_tag['name']}]' before '[/{parsed['name']}]'"
-                )
+                raise ParseError(f"Unexpected close tag '[/{name}]' at index {cursor}")
+            open_name, raw_start, content_start = container_stack.pop()
+            if name != open_name:
+                raise ParseError(f"Unbalanced container. expected '[/{open_name}]' before '[/{name}]'")
             if not container_stack:
-                content = text[open_tag["content_start"] : cursor]
-                raw = text[open_tag["raw_start"] : next_cursor]
-                tags.append(
-                    Tag(
-                        tag_type=TagType.DOUBLE,
-                        namespace=None,
-                        action=open_tag["name"],
-                        params=[],
-                        attributes={},
-                        content=content,
-                        raw=raw,
-                    )
+                content = text[content_start:cursor]
+                raw = text[raw_start:next_cursor]
+                if spans is not None:
+                    spans.append((raw_start, next_cursor))
+                yield Tag(
+                    tag_type=TagType.DOUBLE,
+                    namespace=None,
+                    action=open_name,
+                    params=[],
+                    attributes={},
+                    content=content,
+                    raw=raw,
                 )
             cursor = next_cursor
             continue
@@ -233,38 +338,35 @@ def parse_all(text: str, include_nested: bool = False) -> List[Tag]:
             cursor = next_cursor
             continue
 
-        if kind == "single":
-            tags.append(
-                Tag(
-                    tag_type=TagType.SINGLE,
-                    namespace=None,
-                    action=parsed["name"],
-                    params=[],
-                    attributes={},
-                    content=None,
-                    raw=parsed["raw"],
-                )
+        if spans is not None:
+            spans.append((cursor, next_cursor))
+        if kind == _KIND_SINGLE:
+            tag = Tag(
+                tag_type=TagType.SINGLE,
+                namespace=None,
+                action=parsed[1],
+                params=[],
+                attributes={},
+                content=None,
+                raw=parsed[2],
             )
         else:
-            tags.append(
-                Tag(
-                    tag_type=TagType.CHEATCODE,
-                    namespace=parsed["namespace"],
-                    action=parsed["action"],
-                    params=parsed["params"],
-                    attributes=parsed["attributes"],
-                    content=None,
-                    raw=parsed["raw"],
-                )
+            tag = Tag(
+                tag_type=TagType.CHEATCODE,
+                namespace=parsed[3],
+                action=parsed[1],
+                params=parsed[5],
+                attributes=parsed[4],
+                content=None,
+                raw=parsed[2],
             )
         cursor = next_cursor
+        yield tag
 
     if container_stack:
-        unclosed = container_stack[-1]["name"]
+        unclosed = container_stack[-1][0]
         raise ParseError(f"Unterminated container tag '[{unclosed}]'")
 
-    return tags
-
 
 def parse_container_tags(text: str) -> List[Tag]:
     return [tag for tag in parse_all(text, include_nested=True) if tag.tag_type == TagType.DOUBLE]
@@ -300,10 +402,15 @@ def is_valid_tag(tag_string: str) -> bool:
 
 def remove_tags(text: str) -> str:
     """Remove all tags from text, returning clean content."""
-    tags = parse_all(text)
-    if not tags:
+    spans: List[Tuple[int, int]] = []
+    if not list(_iter_tags(text, False, spans)):
         return text
-    result = text
-    for tag in reversed(tags):
-        result = result.replace(tag.raw, "", 1)
-    return result.strip()
+    # Spans come back in source order and never overlap, so the clean text is
+    # the gaps between them, joined in one pass.
+    pieces: List[str] = []
+    previous = 0
+    for start, end in spans:
+        pieces.append(text[previous:start])
+        previous = end
+    pieces.append(text[previous:])
+    return "".join(pieces).strip()
@@ -23,13 +23,19 @@ Example:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import http.client
+import itertools
 import json
 import os
 import sys
+import threading
 from pathlib import Path
-import urllib.error
-import urllib.request
-from typing import Any, Dict, List
+from types import MappingProxyType
+import urllib.parse
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
@@ -37,8 +43,26 @@ if str(ROOT) not in sys.path:
 
 import captainhook
 
+try:
+    import orjson
+except ImportError:  # optional; the demo runs on stdlib json without it
+    orjson = None
 
-TOOLS_STATE = {"step": 0}
+
+def _json_bytes(value: Any) -> bytes:
+    """Encode a request body; orjson emits UTF-8 bytes directly."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+# Both accept UTF-8 bytes, so response bodies are never decoded to str first.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Step ids shared by all tools. next() on a count is a single call, so
+# concurrently running tools never read the same value.
+_STEPS = itertools.count(1)
 
 
 @captainhook.register("tool:add")
@@ -47,15 +71,142 @@ def tool_add(a: str, b: str) -> Dict[str, Any]:
     lhs = int(a)
     rhs = int(b)
     result = lhs + rhs
-    TOOLS_STATE["step"] += 1
-    return {"tool": "add", "a": lhs, "b": rhs, "result": result, "step": TOOLS_STATE["step"]}
+    return {"tool": "add", "a": lhs, "b": rhs, "result": result, "step": next(_STEPS)}
 
 
 @captainhook.register("tool:note")
 def tool_note(message: str = "") -> Dict[str, Any]:
     """Simple logging tool."""
-    TOOLS_STATE["step"] += 1
-    return {"tool": "note", "message": message, "step": TOOLS_STATE["step"]}
+    return {"tool": "note", "message": message, "step": next(_STEPS)}
+
+
+# Idle keep-alive connections per (scheme, host, port), reused across turns
+# so each turn does not pay a fresh TCP/TLS handshake. A connection is taken
+# out of the pool for the duration of one request, so concurrent loops (see
+# --prompts-file) never share a socket.
+_IDLE_CONNECTIONS: Dict[Tuple[str, str, int | None], List[http.client.HTTPConnection]] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _post(
+    url: str,
+    body: bytes,
+    headers: Mapping[str, str],
+    timeout: int,
+    read: Optional[Callable[[http.client.HTTPResponse], str]] = None,
+) -> Any:
+    """POST `body` over a pooled connection and return the raw response body.
+
+    `read` consumes a successful response incrementally (see `_read_stream`)
+    and its result is returned instead; error responses are always read
+    whole for the error message.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise RuntimeError(f"Unsupported inference URL: {url}")
+    key = (parts.scheme, parts.hostname, parts.port)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    # A pooled connection may have been closed by the server while idle; that
+    # surfaces as a reset on first use, so a reused connection gets one retry
+    # on a fresh socket. Timeouts and other errors are never retried.
+    for attempt in range(2):
+        with _POOL_LOCK:
+            idle = _IDLE_CONNECTIONS.get(key)
+            conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(parts.hostname, parts.port, timeout=timeout)
+        conn.timeout = timeout
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+            response = conn.getresponse()
+            if read is None or response.status >= 400:
+                data = response.read()
+            else:
+                data = read(response)
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            if reused and attempt == 0 and isinstance(exc, (ConnectionResetError, BrokenPipeError)):
+                continue
+            raise RuntimeError(f"Failed to reach inference endpoint: {exc}") from exc
+        if response.will_close:
+            conn.close()
+        else:
+            with _POOL_LOCK:
+                _IDLE_CONNECTIONS.setdefault(key, []).append(conn)
+        if response.status >= 400:
+            body_text = data.decode("utf-8", errors="ignore")
+            raise RuntimeError(f"LLM request failed ({response.status}): {body_text}")
+        return data
+    raise AssertionError("unreachable")
+
+
+def _read_stream(response: http.client.HTTPResponse, on_text: Callable[[str], Any]) -> str:
+    """Collect `delta.content` from a chat-completions SSE body as it arrives."""
+    pieces: List[str] = []
+    for raw_line in response:
+        line = raw_line.strip()
+        # Keep reading past `[DONE]` so the body is fully consumed and the
+        # connection can go back to the pool.
+        if not line.startswith(b"data:") or line == b"data: [DONE]":
+            continue
+        choices = _json_loads(line[5:]).get("choices") or [{}]
+        text = (choices[0].get("delta") or {}).get("content") or ""
+        if text:
+            pieces.append(text)
+            on_text(text)
+    return "".join(pieces)
+
+
+class ResponseCache:
+    """Replay cache for assistant text, one JSON file per request.
+
+    Opt-in (`--cache-dir`): a hit replays the stored text instead of sampling
+    again, so repeated runs of the same prompt skip the endpoint entirely.
+
+    Requests are sent with temperature 0.1, so replies are sampled, not
+    deterministic. A hit replays the one reply that was sampled first, and
+    the endpoint is never asked again for that request. Clear the
+    directory to sample fresh replies.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, url: str, payload: Dict[str, Any]) -> str:
+        blob = json.dumps({"url": url, "payload": payload}, sort_keys=True)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.directory / f"{key}.json"
+        if not path.is_file():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(path.read_text(encoding="utf-8"))["content"]
+
+    def put(self, key: str, content: str) -> None:
+        # Write-then-rename so an interrupted run never leaves a torn entry.
+        path = self.directory / f"{key}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"content": content}), encoding="utf-8")
+        tmp.replace(path)
+
+
+@functools.lru_cache(maxsize=8)
+def _request_headers(api_key: str | None) -> Mapping[str, str]:
+    """Request headers, built once per API key and shared read-only."""
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    return MappingProxyType(headers)
 
 
 def call_inference(
@@ -64,115 +215,199 @@ def call_inference(
     api_key: str | None,
     messages: List[Dict[str, str]],
     timeout: int = 60,
+    cache: Optional[ResponseCache] = None,
+    prompt_cache_key: Optional[str] = None,
+    on_text: Optional[Callable[[str], Any]] = None,
 ) -> str:
-    """Call an OpenAI-style chat endpoint and return the assistant text."""
+    """Call an OpenAI-style chat endpoint and return the assistant text.
+
+    With `on_text`, the reply is requested as a stream and each text delta
+    is passed to `on_text` as it arrives; the full text is still returned.
+    """
     payload: Dict[str, Any] = {
         "model": model,
         "messages": messages,
         "temperature": 0.1,
     }
+    if prompt_cache_key:
+        # OpenAI routing hint for prefix-cache reuse; only sent when asked
+        # for, since other servers may reject unknown fields.
+        payload["prompt_cache_key"] = prompt_cache_key
+    if on_text is not None:
+        payload["stream"] = True
+    if cache is not None:
+        cache_key = cache.key(url, payload)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            if on_text is not None:
+                on_text(cached)
+            return cached
+
+    headers = _request_headers(api_key)
+    body = _json_bytes(payload)
+    if on_text is not None:
+        content = _post(url, body, headers, timeout, read=lambda response: _read_stream(response, on_text))
+    else:
+        response_data = _json_loads(_post(url, body, headers, timeout))
 
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        method="POST",
-    )
-    req.add_header("Content-Type", "application/json")
-    if api_key:
-        req.add_header("Authorization", f"Bearer {api_key}")
+        choices = response_data.get("choices", [])
+        if not choices:
+            raise RuntimeError("Inference response did not include any choices")
 
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            response_data = json.loads(response.read().decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="ignore")
-        raise RuntimeError(f"LLM request failed ({exc.code}): {body}") from exc
-    except urllib.error.URLError as exc:
-        raise RuntimeError(f"Failed to reach inference endpoint: {exc}") from exc
-
-    choices = response_data.get("choices", [])
-    if not choices:
-        raise RuntimeError("Inference response did not include any choices")
-
-    message = choices[0].get("message", {})
-    content = message.get("content", "")
+        message = choices[0].get("message", {})
+        content = message.get("content", "")
     if not content:
         raise RuntimeError("Inference response returned an empty content block")
 
+    if cache is not None:
+        cache.put(cache_key, content)
     return content
 
 
+_SYSTEM_PROMPT = (
+    "You are a tiny planner in a demo loop.\n"
+    "When you want the system to do work, emit tags only in this form:\n"
+    "  [tool:add <a> <b> /]\n"
+    "  [tool:note message=\"text\" /]\n"
+    "  [next /]\n"
+    "Do not emit [next /] if the loop should end.\n"
+)
+
+
 def build_system_prompt() -> str:
     """Prompt for the model with the exact tag contract."""
-    return (
-        "You are a tiny planner in a demo loop.\n"
-        "When you want the system to do work, emit tags only in this form:\n"
-        "  [tool:add <a> <b> /]\n"
-        "  [tool:note message=\"text\" /]\n"
-        "  [next /]\n"
-        "Do not emit [next /] if the loop should end.\n"
-    )
+    return _SYSTEM_PROMPT
 
 
-def run_demo_loop(args: argparse.Namespace) -> None:
+async def run_demo_loop(args: argparse.Namespace, prompt: Optional[str] = None, label: str = "") -> int:
+    """Run the turn loop for one prompt and return the number of turns taken."""
     # State that goes to the model each turn:
     # - system prompt (tool contract)
     # - original user request
     # - assistant text and tool outputs from previous turns
+    #
+    # Chat endpoints are stateless, so every turn resends the whole list. The
+    # fixed prefix (system + user) stays byte-identical and first so server
+    # prefix caches can reuse it; anything that changes per turn (tool
+    # outputs, step counters) is only ever appended at the tail.
     continue_tag = "[next /]"
     messages: List[Dict[str, str]] = [
         {"role": "system", "content": build_system_prompt()},
-        {"role": "user", "content": args.prompt},
+        {"role": "user", "content": args.prompt if prompt is None else prompt},
     ]
+    cache = ResponseCache(args.cache_dir) if args.cache_dir else None
+    # Fire-and-forget tool runs still in flight; they overlap the next
+    # inference request and are awaited before the loop returns.
+    background: List[asyncio.Task] = []
+    say = print if not label else (lambda *parts: print(f"[{label}]", *parts))
+    turn = 0
+    loop = asyncio.get_running_loop()
 
-    for turn in range(1, args.max_turns + 1):
-        print(f"\n=== Turn {turn} ===")
-        model_text = call_inference(
-            url=args.url,
-            model=args.model,
-            api_key=args.api_key,
-            messages=messages,
-        )
-        print(f"LLM output:\n{model_text}\n")
-
-        # Parse tags from the assistant turn. If no tags are present, we can't
-        # drive any more tool calls or loop control, so we exit.
-        tags = captainhook.parse_all(model_text)
-        if not tags:
-            print("No tags found in response. Ending loop.")
-            break
-
-        # Execute tool tags only. `next` is treated as control, not as an executable tag.
-        results_payload = []
-        continue_requested = False
-        for tag in tags:
-            if tag.raw == continue_tag:
-                continue_requested = True
-                continue
-
-            result = captainhook.execute(tag.raw)
-            if tag.namespace and captainhook.get_no_response(tag.namespace, tag.action):
-                # Fire-and-forget tool outputs are not appended back into model context.
-                continue
-
-            results_payload.append({tag.raw: result})
-
-        print(f"Tool results: {json.dumps(results_payload, indent=2)}")
-
-        # Push both the assistant output and tool results back for the next turn.
-        messages.append({"role": "assistant", "content": model_text})
-        messages.append(
-            {
-                "role": "user",
-                "content": f"Tool outputs: {json.dumps(results_payload)}",
-            }
-        )
-
-        if not continue_requested:
-            print("No [next /] tag found. Ending loop.")
-            break
-    else:
-        print("Reached max turns. Ending loop.")
+    try:
+        for turn in range(1, args.max_turns + 1):
+            print()
+            say(f"=== Turn {turn} ===")
+            # Streamed text is echoed as it arrives (single-prompt runs only, so
+            # concurrent loops do not interleave partial lines). Tags are still
+            # parsed from the complete turn: markup cut off mid-stream cannot be
+            # validated yet, and parsing fails closed on unbalanced tags.
+            on_text = None
+            if args.stream and not label:
+                say("LLM output:")
+                on_text = lambda text: print(text, end="", flush=True)
+            # The blocking HTTP call runs in a worker thread so the event loop
+            # keeps driving fire-and-forget tools from earlier turns meanwhile.
+            model_text = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    call_inference,
+                    url=args.url,
+                    model=args.model,
+                    api_key=args.api_key,
+                    messages=messages,
+                    cache=cache,
+                    prompt_cache_key=args.prompt_cache_key,
+                    on_text=on_text,
+                ),
+            )
+            if on_text is None:
+                say(f"LLM output:\n{model_text}\n")
+            else:
+                print("\n")
+
+            # Parse tags from the assistant turn. If no tags are present, we can't
+            # drive any more tool calls or loop control, so we exit.
+            tags = captainhook.parse_all(model_text)
+            if not tags:
+                say("No tags found in response. Ending loop.")
+                break
+
+            # Execute tool tags only. `next` is treated as control, not as an executable tag.
+            continue_requested = False
+            response_tags = []
+            # Repeated (namespace, action) pairs in one reply share one metadata
+            # lookup. The memo is rebuilt each turn so namespaces registered or
+            # removed between turns are always seen.
+            no_response = functools.lru_cache(maxsize=None)(captainhook.get_no_response)
+            for tag in tags:
+                if tag.raw == continue_tag:
+                    continue_requested = True
+                elif tag.namespace and no_response(tag.namespace, tag.action):
+                    # Fire-and-forget tool outputs are not appended back into model context.
+                    background.append(asyncio.create_task(captainhook.execute_tag_async(tag)))
+                else:
+                    response_tags.append(tag)
+
+            # Response-bearing tools run together; sync handlers still complete
+            # in tag order, async handlers overlap their awaits.
+            results = await asyncio.gather(*(captainhook.execute_tag_async(tag) for tag in response_tags))
+            results_payload = [{tag.raw: result} for tag, result in zip(response_tags, results)]
+
+            # Encoded once: the printed line is exactly what the model receives.
+            results_json = json.dumps(results_payload)
+            say(f"Tool results: {results_json}")
+
+            # Push both the assistant output and tool results back for the next turn.
+            messages.append({"role": "assistant", "content": model_text})
+            messages.append({"role": "user", "content": f"Tool outputs: {results_json}"})
+            # Keep the fixed prefix plus the last `--window` turns so request size
+            # stops growing with the turn count. Dropped turns shift the history,
+            # so only the prefix stays cacheable server-side once trimming starts.
+            if args.window > 0 and len(messages) > 2 + 2 * args.window:
+                del messages[2 : -2 * args.window]
+
+            if not continue_requested:
+                say("No [next /] tag found. Ending loop.")
+                break
+        else:
+            say("Reached max turns. Ending loop.")
+    finally:
+        # Fire-and-forget tasks are always awaited, even when a turn raised,
+        # so none is left pending. Their failures are reported here; they are
+        # re-raised below only if the loop itself finished cleanly.
+        outcomes = await asyncio.gather(*background, return_exceptions=True)
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        for error in errors:
+            say(f"Fire-and-forget tool failed: {error!r}")
+    if errors:
+        raise errors[0]
+    if cache is not None:
+        say(f"Response cache: {cache.hits} hits, {cache.misses} misses")
+    return turn
+
+
+async def run_prompts(args: argparse.Namespace, prompts: List[str]) -> None:
+    """Run one loop per prompt, at most `args.concurrency` at a time."""
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def run_one(index: int, prompt: str) -> Tuple[int, int]:
+        async with sem:
+            return index, await run_demo_loop(args, prompt=prompt, label=f"prompt {index}")
+
+    # Results are reported as loops finish, not in file order.
+    for finished in asyncio.as_completed([run_one(i, p) for i, p in enumerate(prompts, 1)]):
+        index, turns = await finished
+        print(f"[prompt {index}] finished after {turns} turn(s)")
 
 
 def parse_args() -> argparse.Namespace:
@@ -205,6 +440,40 @@ def parse_args() -> argparse.Namespace:
         default=6,
         help="Safety limit for [next /] loops.",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Request a streamed reply and print it as it arrives.",
+    )
+    parser.add_argument(
+        "--prompts-file",
+        help="Run one loop per non-empty line of this file instead of --prompt.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum loops in flight with --prompts-file.",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=4,
+        help="Turns of history resent to the model after the prompt (0 keeps all).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.getenv("INFERENCE_CACHE_DIR"),
+        help=(
+            "Replay identical requests from this directory instead of calling the endpoint. "
+            "Replies are sampled (temperature 0.1), so a hit replays the first sampled reply."
+        ),
+    )
+    parser.add_argument(
+        "--prompt-cache-key",
+        default=os.getenv("INFERENCE_PROMPT_CACHE_KEY"),
+        help="Send prompt_cache_key so the endpoint can reuse the cached prompt prefix.",
+    )
     return parser.parse_args()
 
 
@@ -212,7 +481,11 @@ def main() -> None:
     args = parse_args()
     if not args.url:
         raise SystemExit("Missing --url (or set INFERENCE_URL in env).")
-    run_demo_loop(args)
+    if args.prompts_file:
+        lines = Path(args.prompts_file).read_text(encoding="utf-8").splitlines()
+        asyncio.run(run_prompts(args, [line for line in lines if line.strip()]))
+    else:
+        asyncio.run(run_demo_loop(args))
 
 
 if __name__ == "__main__":
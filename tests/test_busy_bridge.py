@@ -10,6 +10,7 @@ import pytest
 from captainhook import (
     Context,
     busy38_hooks,
+    emit_async,
     HookPoints,
     register_namespace,
     get_no_response,
@@ -76,6 +77,106 @@ class TestBusyBridgeNamespace:
         finally:
             unregister_namespace("strict")
 
+    def test_namespace_policy_is_built_at_registration(self):
+        class Probe:
+            def execute(self, action, **kwargs):
+                return action
+
+        with pytest.raises(TypeError):
+            register_namespace("badpolicy", Probe(), metadata={"allowed_actions": "ping"})
+        assert get_namespace("badpolicy") is None
+
+        register_namespace(
+            "guarded",
+            Probe(),
+            metadata={
+                "forbid_dangermeta": True,
+                "actions": {"wipe": {"forbid": True}, "ping": {"forbid": False}},
+            },
+        )
+        try:
+            assert execute_cheatcode("guarded", "ping") == "ping"
+            assert execute_cheatcode("guarded", "other") == "other"
+            with pytest.raises(ValueError):
+                execute_cheatcode("guarded", "wipe")
+            with pytest.raises(ValueError):
+                execute_cheatcode("guarded", "WIPE")
+        finally:
+            unregister_namespace("guarded")
+
+    def test_lock_free_reads_during_concurrent_writes(self):
+        import threading
+
+        from captainhook.busy_bridge import NamespaceRegistry
+
+        class Probe:
+            def execute(self, action, **kwargs):
+                return action
+
+        registry = NamespaceRegistry()
+        registry.register("stable", Probe(), metadata={"allowed_actions": ["ping"]})
+        errors = []
+        done = threading.Event()
+
+        def writer():
+            for index in range(300):
+                registry.register(f"churn{index}", Probe())
+                registry.unregister(f"churn{index}")
+            done.set()
+
+        def reader():
+            while not done.is_set():
+                try:
+                    assert registry.execute("stable", "ping") == "ping"
+                    assert "stable" in registry
+                    registry.list_namespaces()
+                except Exception as exc:
+                    errors.append(exc)
+                    return
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert registry.list_namespaces() == ["stable"]
+
+    def test_register_requires_callable_execute(self):
+        class NoExecute:
+            pass
+
+        with pytest.raises(TypeError):
+            register_namespace("noexec", NoExecute())
+        assert get_namespace("noexec") is None
+
+    def test_registry_rejects_non_ascii_and_dunder_identifiers(self):
+        class Probe:
+            def execute(self, action, **kwargs):
+                return action
+
+        for name in ("caf\u00e9", "__dunder__", "1digit", "bad name", "", "n" * 129):
+            with pytest.raises(ValueError):
+                register_namespace(name, Probe())
+        register_namespace("n" * 128, Probe())
+        unregister_namespace("n" * 128)
+        # Rejections are not memoized; a repeat still fails closed.
+        with pytest.raises(ValueError):
+            register_namespace("caf\u00e9", Probe())
+
+    def test_only_registration_interns_identifiers(self):
+        """Execute-time validation must not add untrusted names to the intern table."""
+        import sys
+
+        from captainhook.busy_bridge import _registration_key, _validate_identifier
+
+        probe = "".join(["exec_time_", "probe_name"])
+        _validate_identifier(probe)
+        assert sys.intern("".join(["exec_time_", "probe_name"])) is not probe
+
+        registered = "".join(["registration_", "probe_name"])
+        assert _registration_key(registered) is sys.intern("".join(["registration_", "probe_name"]))
+
     def test_async_namespace_execution_from_execute_async(self):
         class AsyncProbe:
             async def execute(self, action, **kwargs):
@@ -114,6 +215,24 @@ class TestBusyBridgeNamespace:
         finally:
             unregister_namespace("snakecase")
 
+    def test_no_response_cache_follows_reregistration(self):
+        class Probe:
+            def execute(self, action, **kwargs):
+                return {"ok": True}
+
+        register_namespace("memoized", Probe(), metadata={"noResponse": True})
+        try:
+            assert should_suppress_cheatcode_response("memoized", "ping") is True
+            assert should_suppress_cheatcode_response("memoized", "ping") is True
+        finally:
+            unregister_namespace("memoized")
+        assert should_suppress_cheatcode_response("memoized", "ping") is False
+        register_namespace("memoized", Probe(), metadata={"noResponse": False})
+        try:
+            assert should_suppress_cheatcode_response("memoized", "ping") is False
+        finally:
+            unregister_namespace("memoized")
+
     def test_action_level_no_response_overrides_namespace_default(self):
         class Probe:
             def execute(self, action, **kwargs):
@@ -196,6 +315,113 @@ class TestBusyBridgeHooks:
         finally:
             busy38_hooks.remove_action("bridge:inspect", action_id)
 
+    def test_single_callback_still_receives_frozen_arguments(self):
+        attrs = {"value": "1"}
+        errors = []
+
+        def mutate(namespace, action, payload, context=None):
+            try:
+                payload["value"] = "smuggled"
+            except TypeError as exc:
+                errors.append(exc)
+
+        action_id = busy38_hooks.add_action("bridge:freeze", mutate)
+        try:
+            busy38_hooks.do_action("bridge:freeze", "ns", "act", attrs, context={"phase": "pre"})
+        finally:
+            busy38_hooks.remove_action("bridge:freeze", action_id)
+        assert attrs == {"value": "1"}
+        assert len(errors) == 1
+
+    def test_emit_and_apply_pass_frozen_context(self):
+        from captainhook.busy_bridge import apply, emit
+
+        context = {"phase": "pre"}
+        seen = []
+
+        def observe(value, context=None):
+            seen.append((value, context))
+            with pytest.raises(TypeError):
+                context["phase"] = "smuggled"
+
+        def upper(value, context=None):
+            return value.upper() + context["phase"]
+
+        action_id = busy38_hooks.add_action("bridge:ctx", observe)
+        filter_id = busy38_hooks.add_filter("bridge:ctx", upper)
+        try:
+            emit("bridge:ctx", "v", context=context)
+            assert apply("bridge:ctx", "v", context=context) == "Vpre"
+        finally:
+            busy38_hooks.remove_action("bridge:ctx", action_id)
+            busy38_hooks.remove_filter("bridge:ctx", filter_id)
+        assert seen == [("v", {"phase": "pre"})]
+        assert context == {"phase": "pre"}
+
+    def test_emit_async_runs_sync_and_coroutine_callbacks(self):
+        events = []
+
+        def sync_cb(value, context=None):
+            events.append(("sync", value, context["phase"]))
+
+        async def slow_cb(value, context=None):
+            await asyncio.sleep(0.01)
+            events.append(("slow", value))
+
+        async def fast_cb(value, context=None):
+            events.append(("fast", value))
+
+        async def broken_cb(value, context=None):
+            raise RuntimeError("isolated")
+
+        ids = [
+            busy38_hooks.add_action("bridge:async", slow_cb, priority=1),
+            busy38_hooks.add_action("bridge:async", broken_cb, priority=2),
+            busy38_hooks.add_action("bridge:async", fast_cb, priority=3),
+            busy38_hooks.add_action("bridge:async", sync_cb, priority=4),
+        ]
+        try:
+            asyncio.run(emit_async("bridge:async", "v", context={"phase": "pre"}))
+        finally:
+            for action_id in ids:
+                busy38_hooks.remove_action("bridge:async", action_id)
+
+        assert events[0] == ("sync", "v", "pre")
+        assert set(events[1:]) == {("fast", "v"), ("slow", "v")}
+        assert events[-1] == ("slow", "v")
+
+    def test_concurrent_registration_across_hooks(self):
+        import threading
+
+        from captainhook.busy_bridge import BusyHookRegistry
+
+        registry = BusyHookRegistry()
+        ids = []
+
+        def worker(index):
+            for _ in range(50):
+                ids.append(registry.add_action(f"stripe:{index % 8}", lambda: None))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(ids)) == 16 * 50
+        assert registry.get_stats()["total_hooks"] == 16 * 50
+        assert registry.list_hooks() == sorted(f"stripe:{i}" for i in range(8))
+
+    def test_presence_check_tracks_registration(self):
+        assert busy38_hooks.has_action("bridge:presence") is False
+        action_id = busy38_hooks.add_action("bridge:presence", lambda *_a, **_k: None)
+        try:
+            assert busy38_hooks.has_action("bridge:presence") is True
+            assert busy38_hooks.has_filter("bridge:presence") is False
+        finally:
+            busy38_hooks.remove_action("bridge:presence", action_id)
+        assert busy38_hooks.has_action("bridge:presence") is False
+
     def test_critical_hook_removal_requires_token(self):
         event = []
 
@@ -218,3 +444,215 @@ class TestBusyBridgeHooks:
                 )
             else:
                 assert event == []
+
+    def test_critical_hook_removal_compares_token_bytes(self, monkeypatch):
+        from captainhook import busy_bridge
+
+        monkeypatch.setattr(busy_bridge, "_HOOK_REMOVAL_TOKEN", "s\u00e9cret")
+        monkeypatch.setattr(busy_bridge, "_HOOK_REMOVAL_TOKEN_BYTES", "s\u00e9cret".encode("utf-8"))
+        action_id = busy38_hooks.add_action(HookPoints.POST_CHEATCODE_EXECUTE, lambda *a, **k: None)
+        for wrong in ("secret", "s\u00e8cret", b"s\xc3\xa9cret"):
+            with pytest.raises(PermissionError):
+                busy38_hooks.remove_action(
+                    HookPoints.POST_CHEATCODE_EXECUTE, action_id, allow_critical=True, removal_token=wrong
+                )
+        assert busy38_hooks.remove_action(
+            HookPoints.POST_CHEATCODE_EXECUTE, action_id, allow_critical=True, removal_token="s\u00e9cret"
+        )
+
+    def test_whole_registry_reads_with_locked_fallback(self, monkeypatch):
+        from captainhook import busy_bridge
+        from captainhook.busy_bridge import BusyHookRegistry
+
+        monkeypatch.setattr(busy_bridge, "_LOCK_FREE_READS", False)
+        registry = BusyHookRegistry()
+        registry.add_action("fallback:a", lambda: None)
+        registry.add_filter("fallback:b", lambda value: value)
+        assert registry.list_hooks() == ["fallback:a", "fallback:b"]
+        assert registry.get_stats() == {"total_hooks": 1, "total_filters": 1}
+        assert not any(lock.locked() for lock in registry._stripe_locks)
+
+    def test_bulk_register_orders_once_and_is_all_or_nothing(self):
+        from captainhook import register_hooks
+        from captainhook.busy_bridge import BusyHookRegistry
+
+        registry = BusyHookRegistry()
+        calls = []
+        registry.add_action("bulk:a", lambda: calls.append("existing"), priority=5)
+        action_ids, filter_ids = registry.bulk_register(
+            actions=[
+                ("bulk:a", lambda: calls.append("late"), 20),
+                ("bulk:a", lambda: calls.append("early"), 1),
+                ("bulk:b", lambda: calls.append("b"), 10),
+            ],
+            filters=[("bulk:f", lambda value: value + 1, 10)],
+        )
+        assert len(action_ids) == 3 and len(filter_ids) == 1
+        registry.do_action("bulk:a")
+        assert calls == ["early", "existing", "late"]
+        assert registry.apply("bulk:f", 1) == 2
+
+        with pytest.raises(TypeError):
+            registry.bulk_register(actions=[("bulk:c", lambda: None, 10), ("bulk:d", "not callable", 10)])
+        assert not registry.has_action("bulk:c")
+
+        ids = register_hooks({"bulk:global": lambda: None})
+        try:
+            assert busy38_hooks.has_action("bulk:global")
+        finally:
+            busy38_hooks.remove_action("bulk:global", ids[0])
+
+    def test_equal_priorities_keep_registration_order_after_removal(self):
+        from captainhook.busy_bridge import BusyHookRegistry
+
+        registry = BusyHookRegistry()
+        calls = []
+        ids = {}
+        for name, priority in (("a", 10), ("b", 5), ("c", 10), ("d", 5), ("e", 10)):
+            ids[name] = registry.add_action("fifo:hook", lambda name=name: calls.append(name), priority=priority)
+        registry.remove_action("fifo:hook", ids["c"])
+        registry.add_action("fifo:hook", lambda: calls.append("f"), priority=10)
+        registry.do_action("fifo:hook")
+        assert calls == ["b", "d", "a", "e", "f"]
+
+    def test_id_removal_is_scoped_to_hook_and_kind(self):
+        from captainhook.busy_bridge import BusyHookRegistry
+
+        registry = BusyHookRegistry()
+        action_id = registry.add_action("index:a", lambda: None)
+        filter_id = registry.add_filter("index:a", lambda value: value)
+        assert action_id == filter_id  # separate counters
+        assert registry.remove_action("index:b", action_id) is False
+        assert registry.remove_filter("index:a", filter_id) is True
+        assert registry.remove_filter("index:a", filter_id) is False
+        assert registry.has_action("index:a")
+        assert registry.remove_action("index:a", action_id) is True
+        assert registry._action_index == {} and registry._filter_index == {}
+
+    def test_callbacks_may_reenter_registries_without_deadlock(self):
+        from captainhook.busy_bridge import BusyHookRegistry, NamespaceRegistry
+
+        registry = BusyHookRegistry()
+        namespaces = NamespaceRegistry()
+        late_calls = []
+
+        def reenter():
+            late_id = registry.add_action("reenter:hook", lambda: late_calls.append("late"))
+            registry.remove_action("reenter:hook", late_id)
+            registry.list_hooks()
+
+        class Nested:
+            def execute(self, action, **kwargs):
+                namespaces.register("inner", self)
+                return namespaces.list_namespaces()
+
+        registry.add_action("reenter:hook", reenter)
+        registry.do_action("reenter:hook")
+        namespaces.register("outer", Nested())
+        assert namespaces.execute("outer", "go") == ["inner", "outer"]
+        assert late_calls == []
+
+    def test_registration_rejects_non_callables(self):
+        from captainhook.busy_bridge import BusyHookRegistry
+
+        registry = BusyHookRegistry()
+        with pytest.raises(TypeError):
+            registry.add_action("callable:check", "not callable")
+        with pytest.raises(TypeError):
+            registry.add_filter("callable:check", None)
+        assert not registry.has_action("callable:check")
+        assert not registry.has_filter("callable:check")
+
+    def test_execute_async_emits_cheatcode_bridge_hooks(self, monkeypatch):
+        from captainhook import busy_bridge
+
+        monkeypatch.setattr(busy_bridge, "_HOOK_REMOVAL_TOKEN", "t")
+        monkeypatch.setattr(busy_bridge, "_HOOK_REMOVAL_TOKEN_BYTES", b"t")
+        events = []
+
+        def pre(namespace, action, attrs, context=None):
+            events.append(("pre", namespace, action, dict(attrs)))
+
+        def post(namespace, action, result, context=None):
+            events.append(("post", namespace, action, result))
+
+        ctx = Context()
+
+        @ctx.register("aio:echo")
+        async def echo(value):
+            return value
+
+        pre_id = busy38_hooks.add_action(HookPoints.PRE_CHEATCODE_EXECUTE, pre)
+        post_id = busy38_hooks.add_action(HookPoints.POST_CHEATCODE_EXECUTE, post)
+        try:
+            assert asyncio.run(ctx.execute_async('[aio:echo value="x" /]')) == "x"
+        finally:
+            for hook_name, hook_id in (
+                (HookPoints.PRE_CHEATCODE_EXECUTE, pre_id),
+                (HookPoints.POST_CHEATCODE_EXECUTE, post_id),
+            ):
+                busy38_hooks.remove_action(hook_name, hook_id, allow_critical=True, removal_token="t")
+        assert events == [("pre", "aio", "echo", {"value": "x"}), ("post", "aio", "echo", "x")]
+
+    def test_cheatcode_post_hook_gets_context_without_pre_subscriber(self, monkeypatch):
+        from captainhook import busy_bridge
+
+        monkeypatch.setattr(busy_bridge, "_HOOK_REMOVAL_TOKEN", "t")
+        monkeypatch.setattr(busy_bridge, "_HOOK_REMOVAL_TOKEN_BYTES", b"t")
+        contexts = []
+
+        ctx = Context()
+        ctx.register("ctxprobe:echo")(lambda value, **kwargs: value)
+
+        post_id = busy38_hooks.add_action(
+            HookPoints.POST_CHEATCODE_EXECUTE,
+            lambda namespace, action, result, context=None: contexts.append(dict(context)),
+        )
+        try:
+            assert ctx.execute('[ctxprobe:echo value="x" /]', session="s1") == "x"
+        finally:
+            busy38_hooks.remove_action(
+                HookPoints.POST_CHEATCODE_EXECUTE, post_id, allow_critical=True, removal_token="t"
+            )
+        assert len(contexts) == 1
+        assert contexts[0]["namespace"] == "ctxprobe"
+        assert contexts[0]["action"] == "echo"
+        assert contexts[0]["session"] == "s1"
+
+    def test_remove_all_drops_many_hooks_and_checks_critical_first(self):
+        from captainhook.busy_bridge import BusyHookRegistry
+
+        registry = BusyHookRegistry()
+        for name in ("plugin:a", "plugin:b", "plugin:c"):
+            registry.add_action(name, lambda: None)
+        registry.add_filter("plugin:a", lambda value: value)
+        registry.add_action(HookPoints.PRE_CHEATCODE_EXECUTE, lambda *a, **k: None)
+
+        with pytest.raises(PermissionError):
+            registry.remove_all(["plugin:a", HookPoints.PRE_CHEATCODE_EXECUTE])
+        assert registry.has_action("plugin:a") and registry.has_filter("plugin:a")
+
+        assert registry.remove_all(["plugin:a", "plugin:b", "plugin:a", "plugin:missing"]) == 3
+        assert registry.list_hooks() == sorted([HookPoints.PRE_CHEATCODE_EXECUTE, "plugin:c"])
+
+    def test_dispatch_iterates_the_bucket_published_before_it_started(self):
+        from captainhook.busy_bridge import BusyHookRegistry
+
+        registry = BusyHookRegistry()
+        calls = []
+        ids = {}
+
+        def first():
+            calls.append("first")
+            ids["added"] = registry.add_action("snap:hook", lambda: calls.append("added"), priority=20)
+            registry.remove_action("snap:hook", ids["second"])
+
+        registry.add_action("snap:hook", first, priority=1)
+        ids["second"] = registry.add_action("snap:hook", lambda: calls.append("second"), priority=10)
+        registry.do_action("snap:hook")
+        assert calls == ["first", "second"]
+
+        calls.clear()
+        registry.remove_action("snap:hook", first)
+        registry.do_action("snap:hook")
+        assert calls == ["added"]
@@ -28,7 +28,35 @@ class TestCore:
 
         with pytest.raises(ValueError):
             ctx.execute('[safe:set value="from_tag" /]', value="from_runtime")
+
+    def test_register_rejects_non_ascii_identifiers(self):
+        """Confusable Unicode names must not register as distinct handlers."""
+        ctx = Context()
+        for pattern in ("t\u0435st:action", "test:\u0430ction", "__test", "x" * 129, "ns:" + "x" * 129):
+            with pytest.raises(ValueError):
+                ctx.register(pattern)
+        ctx.register("x" * 128)
+        with pytest.raises(ValueError, match="exceeds"):
+            ctx.execute('[x:probe %s="v" /]' % ("k" * 129))
     
+    def test_dispatch_follows_action_rewritten_by_hook(self):
+        """A before_execute hook that rewrites the tag changes what runs, sync and async."""
+        import asyncio
+
+        ctx = Context()
+        ctx.register("danger")(lambda: "danger ran")
+        ctx.register("safe")(lambda: "safe ran")
+        ctx.register("ns:danger")(lambda: "ns danger ran")
+        ctx.register("ns:safe")(lambda: "ns safe ran")
+
+        def rewrite(tag, **_kwargs):
+            tag.action = "safe"
+
+        ctx.hooks.add_action("before_execute", rewrite)
+        assert ctx.execute("[danger /]") == "safe ran"
+        assert ctx.execute("[ns:danger /]") == "ns safe ran"
+        assert asyncio.run(ctx.execute_async("[ns:danger /]")) == "ns safe ran"
+
     def test_container_handler(self):
         """Test container tag execution."""
         ctx = Context()
@@ -88,6 +116,292 @@ class TestCore:
         
         assert calls == ["before", "handler", "after"]
 
+    def test_hook_removed_during_dispatch_does_not_skip_others(self):
+        """Dispatch iterates an immutable bucket, so removal mid-dispatch is safe."""
+        from captainhook import Hooks
+
+        hooks = Hooks()
+        calls = []
+
+        def first():
+            calls.append("first")
+            hooks.remove_action("evt", first)
+
+        hooks.add_action("evt", first)
+        hooks.add_action("evt", lambda: calls.append("second"))
+        hooks.do_action("evt")
+        hooks.do_action("evt")
+        assert calls == ["first", "second", "second"]
+
+    def test_cached_parse_returns_isolated_tags(self):
+        """Repeated tag strings are parsed once but handlers never share Tag state."""
+        ctx = Context()
+        seen = []
+
+        def mutate(tag, **_kwargs):
+            seen.append(dict(tag.attributes))
+            tag.attributes["injected"] = "x"
+            tag.params.append("extra")
+
+        ctx.hooks.add_action("before_execute", mutate)
+        ctx.register("cache:probe")(lambda *args, **kwargs: (args, dict(kwargs)))
+
+        first = ctx.execute('[cache:probe one k="v" /]')
+        second = ctx.execute('[cache:probe one k="v" /]')
+        # The mutation leaks into its own execution only, never into the cache.
+        assert first == second == (("one", "extra"), {"k": "v", "injected": "x"})
+        assert seen == [{"k": "v"}, {"k": "v"}]
+
+    def test_cached_text_parse_returns_isolated_tags(self):
+        """Resubmitted text reuses its parse, but each run gets fresh Tag objects."""
+        ctx = Context()
+        seen = []
+
+        def mutate(tag, **_kwargs):
+            seen.append(dict(tag.attributes))
+            tag.attributes["injected"] = "x"
+
+        ctx.hooks.add_action("before_execute", mutate)
+        ctx.register("cache:text")(lambda **kwargs: dict(kwargs))
+
+        text = 'one [cache:text k="v" /] two [cache:text k="w" /]'
+        first = ctx.execute_text(text)
+        second = ctx.execute_text(text)
+        assert first == second == [{"k": "v", "injected": "x"}, {"k": "w", "injected": "x"}]
+        assert seen == [{"k": "v"}, {"k": "w"}, {"k": "v"}, {"k": "w"}]
+
+    def test_execute_async_awaits_results_not_handler_kind(self):
+        """Awaiting is decided per result, so sync wrappers returning coroutines work."""
+        import asyncio
+
+        ctx = Context()
+
+        async def fetch(value):
+            return f"async {value}"
+
+        @ctx.register("aio:native")
+        async def native(value):
+            return f"native {value}"
+
+        ctx.register("aio:wrapped")(lambda value: fetch(value))
+        ctx.register("aio:plain")(lambda value: f"plain {value}")
+
+        assert asyncio.run(ctx.execute_async('[aio:native value="a" /]')) == "native a"
+        assert asyncio.run(ctx.execute_async('[aio:wrapped value="b" /]')) == "async b"
+        assert asyncio.run(ctx.execute_async('[aio:plain value="c" /]')) == "plain c"
+
+    def test_local_cheatcode_handlers_take_priority_over_namespaces(self):
+        """A local handler shadows the namespace handler; namespaces resolve on every call."""
+        ctx = Context()
+
+        class Probe:
+            def execute(self, action, **kwargs):
+                return f"namespace {action}"
+
+        ctx.register_namespace("dc", Probe())
+        assert ctx.execute("[dc:ping /]") == "namespace ping"
+
+        ctx.register("dc:ping")(lambda: "local ping")
+        assert ctx.execute("[dc:ping /]") == "local ping"
+
+        assert ctx.execute("[dc:pong /]") == "namespace pong"
+        ctx.unregister_namespace("dc")
+        with pytest.raises(ValueError):
+            ctx.execute("[dc:pong /]")
+
+    def test_filters_order_by_priority_then_registration(self):
+        """Filters run lowest priority first and FIFO within a priority."""
+        from captainhook import Filters
+
+        filters = Filters()
+        for suffix, priority in (("a", 10), ("b", 5), ("c", 10), ("d", 5)):
+            filters.add_filter("chain", lambda value, suffix=suffix: value + suffix, priority)
+        assert filters.apply_filters("chain", "") == "bdac"
+
+    def test_actions_order_by_priority_then_registration(self):
+        """Actions run lowest priority first and FIFO within a priority."""
+        from captainhook import Hooks
+
+        hooks = Hooks()
+        calls = []
+        for name, priority in (("a", 10), ("b", 5), ("c", 10), ("d", 5)):
+            hooks.add_action("evt", lambda name=name: calls.append(name), priority)
+        hooks.do_action("evt")
+        assert calls == ["b", "d", "a", "c"]
+
+    def test_filter_dict_arguments_are_views_unless_strict(self):
+        """Dict arguments are read-only either way; strict mode also snapshots them."""
+        from captainhook import Filters
+
+        for strict, expect_live in ((False, True), (True, False)):
+            filters = Filters(strict=strict)
+            captured = []
+            filters.add_filter("meta", lambda value, meta: captured.append(meta) or value)
+            payload = {"k": "v"}
+            filters.apply_filters("meta", None, payload)
+            with pytest.raises(TypeError):
+                captured[0]["k"] = "changed"
+            payload["k"] = "later"
+            assert (captured[0]["k"] == "later") is expect_live
+
+    def test_callback_errors_propagate_unless_handled(self):
+        """Hook and filter exceptions surface unless the registration supplies on_error."""
+        from captainhook import Filters, Hooks
+
+        def boom(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        hooks = Hooks()
+        hooks.add_action("evt", boom)
+        with pytest.raises(RuntimeError):
+            hooks.do_action("evt")
+
+        errors = []
+        calls = []
+        hooks = Hooks()
+        hooks.add_action("evt", boom, on_error=errors.append)
+        hooks.add_action("evt", lambda: calls.append("after"))
+        hooks.do_action("evt")
+        assert calls == ["after"] and [str(e) for e in errors] == ["boom"]
+
+        filters = Filters()
+        filters.add_filter("value", boom, priority=5, on_error=errors.append)
+        filters.add_filter("value", lambda value: value + "!")
+        assert filters.apply_filters("value", "ok") == "ok!"
+        assert len(errors) == 2
+
+        filters.add_filter("value", boom, priority=20)
+        with pytest.raises(RuntimeError):
+            filters.apply_filters("value", "ok")
+
+    def test_bridge_exports_load_lazily(self):
+        """Importing the package must not import the bridge until a bridge name is used."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, captainhook\n"
+            "assert 'captainhook.busy_bridge' not in sys.modules\n"
+            "from captainhook import HookPoints\n"
+            "assert 'captainhook.busy_bridge' in sys.modules\n"
+            "assert captainhook.HookPoints is HookPoints\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_handler_cannot_mutate_caller_or_hook_kwargs(self):
+        """Each call site receives its own kwargs dict."""
+        ctx = Context()
+        seen = []
+
+        @ctx.register("mutate")
+        def mutate(**kwargs):
+            kwargs["user"] = "root"
+            return "ok"
+
+        ctx.hooks.add_action("after_execute", lambda tag, result, **kw: seen.append(kw))
+        runtime = {"user": "alice"}
+        assert ctx.execute("[mutate /]", **runtime) == "ok"
+        assert runtime == {"user": "alice"}
+        assert seen == [{"user": "alice"}]
+
+    def test_get_no_response_reads_per_action_metadata(self):
+        """Per-action metadata overrides the namespace default in every container."""
+        ctx = Context()
+
+        class Probe:
+            def execute(self, action, **kwargs):
+                return action
+
+        ctx.register_namespace(
+            "quiet",
+            Probe(),
+            metadata={"noResponse": False, "action_metadata": {"hush": {"noResponse": True}}},
+        )
+        assert ctx.get_no_response("quiet", "hush") is True
+        assert ctx.get_no_response("quiet", "HUSH") is True
+        assert ctx.get_no_response("quiet", "talk") is False
+
+    def test_core_objects_are_slotted(self):
+        """Context, Hooks, Filters and Tag reject attributes outside their slots."""
+        from captainhook import Filters, Hooks
+        from captainhook.parser import parse_tag
+
+        for obj in (Context(), Hooks(), Filters(), parse_tag("[slot:probe /]")):
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(AttributeError):
+                obj.unexpected = True
+
+    def test_execute_text_async_overlaps_only_parallel_runs(self):
+        """Adjacent parallel tags overlap; other tags act as ordered barriers."""
+        import asyncio
+
+        ctx = Context()
+        events = []
+
+        @ctx.register("io:fetch", parallel=True)
+        async def fetch(name):
+            events.append(f"start {name}")
+            await asyncio.sleep(0)
+            events.append(f"end {name}")
+            return name
+
+        @ctx.register("io:mark")
+        def mark():
+            events.append("mark")
+            return "mark"
+
+        text = "[io:fetch a /][io:fetch b /][io:mark /][io:fetch c /][io:missing /]"
+        results = asyncio.run(ctx.execute_text_async(text))
+
+        assert results[:4] == ["a", "b", "mark", "c"]
+        assert results[4]["tag"] == "[io:missing /]"
+        assert events == ["start a", "start b", "end a", "end b", "mark", "start c", "end c"]
+
+    def test_iter_execute_text_runs_tags_on_demand(self):
+        """Results stream in order and unconsumed tags never execute."""
+        from captainhook import iter_execute_text
+
+        ctx = Context()
+        calls = []
+
+        @ctx.register("it:step")
+        def step(n):
+            calls.append(n)
+            return int(n)
+
+        results = ctx.iter_execute_text("[it:step 1 /][nope /][it:step 3 /]")
+        assert next(results) == 1
+        assert next(results)["tag"] == "[nope /]"
+        assert calls == ["1"]
+        assert list(results) == [3]
+        assert callable(iter_execute_text)
+
+    def test_execute_tag_runs_parsed_tags_through_full_pipeline(self):
+        """Module-level execute_tag(_async) validate and fire hooks like execute."""
+        import asyncio
+
+        import captainhook
+        from captainhook.core import _global_context
+
+        calls = []
+
+        def record(tag, **_kwargs):
+            calls.append(tag.raw)
+
+        captainhook.register("parsed:echo")(lambda value: value)
+        _global_context.hooks.add_action("before_execute", record)
+        try:
+            tag = captainhook.parse_all('say [parsed:echo value="a" /]')[0]
+            assert captainhook.execute_tag(tag) == "a"
+            assert asyncio.run(captainhook.execute_tag_async(tag)) == "a"
+            assert calls == ['[parsed:echo value="a" /]'] * 2
+
+            tag.attributes["__class__"] = "x"
+            with pytest.raises(ValueError):
+                captainhook.execute_tag(tag)
+        finally:
+            _global_context.hooks.remove_action("before_execute", record)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -30,6 +30,24 @@ class TestParser:
         assert tag.action == "navigate"
         assert "https://example.com" in tag.params
     
+    def test_tag_key_tracks_namespace_and_action(self):
+        """The handler lookup key follows the tag's live namespace and action."""
+        tag = parse_tag("[browser:navigate /]")
+        assert tag.key == "browser:navigate"
+        tag.action = "back"
+        assert tag.key == "browser:back"
+        tag.namespace = None
+        assert tag.key == "back"
+        assert parse_tag("[hello /]").key == "hello"
+
+    def test_parsed_names_are_not_interned(self):
+        """Untrusted names from parsed text stay out of the intern table."""
+        import sys
+
+        tag = parse_tag('[uninterned_ns:uninterned_act uninterned_key="v" /]')
+        for name in (tag.namespace, tag.action, next(iter(tag.attributes))):
+            assert sys.intern("".join([name[:5], name[5:]])) is not name
+
     def test_parse_container(self):
         """Test parsing [tag]content[/tag] containers."""
         tag = parse_tag("[echo]Hello World[/echo]")
@@ -85,6 +103,65 @@ class TestParser:
         assert tags[0].action == "mission"
         assert "[agent_tools:run" in tags[0].raw
 
+    def test_argument_tokenizer_matches_posix_shell_quoting(self):
+        """The built-in tokenizer splits arguments exactly like shlex.split(posix=True)."""
+        import shlex
+
+        from captainhook.parser import _split_args
+
+        samples = [
+            'one two key="hello world" other=\'x y\'',
+            'a"b c"d \'\' "" e\\ f',
+            '"esc \\" \\\\ \\n" \'lit \\" \'',
+            "tab\tsep\r\nline  trailing ",
+            "caf\u00e9 \u00a0nbsp",
+        ]
+        for sample in samples:
+            assert _split_args(sample, 0) == shlex.split(sample, posix=True)
+        for broken in ('open "quote', "open 'quote", "dangling\\"):
+            with pytest.raises(ParseError):
+                _split_args(broken, 0)
+
+    def test_remove_tags_cuts_each_tag_at_its_own_position(self):
+        """Removal uses parsed spans, so tag text quoted inside another tag cannot misfire."""
+        from captainhook.parser import remove_tags
+
+        text = 'a [ns:x v="[d /]" /] b [d /] c [box][d /][/box] d'
+        assert remove_tags(text) == "a  b  c  d"
+        assert remove_tags("no tags here ") == "no tags here "
+
+    def test_scanner_character_classes_match_str_predicates(self):
+        """Compiled identifier/whitespace classes agree with str.isalnum()/isspace()."""
+        from captainhook.parser import _IDENTIFIER_TAIL, _WHITESPACE
+
+        for ch in ("a", "Z", "9", "_", "-", "\u00e9", "\u00b2", "\u0660", " ", "\x1c", "\u2003", ":", "/", "]"):
+            assert bool(_IDENTIFIER_TAIL.fullmatch(ch)) == (ch.isalnum() or ch in "_-")
+            assert bool(_WHITESPACE.fullmatch(ch)) == ch.isspace()
+
+    def test_iter_tags_is_lazy_but_execute_text_validates_first(self):
+        """iter_tags yields before later markup is checked; execution never does."""
+        from captainhook import Context, iter_tags
+
+        text = "[a /] [b /] [open]never closed"
+        tags = iter_tags(text)
+        assert next(tags).action == "a"
+        assert next(tags).action == "b"
+        with pytest.raises(ParseError):
+            next(tags)
+
+        ctx = Context()
+        calls = []
+        ctx.register("a")(lambda: calls.append("a"))
+        with pytest.raises(ParseError):
+            ctx.execute_text(text)
+        assert calls == []
+
+    def test_quoted_key_value_token_is_an_attribute(self):
+        """Quoting inside a key=value token does not change how it is classified."""
+        tag = parse_tag('[ns:act "k=v w" p /]')
+        assert tag.attributes == {"k": "v w"}
+        assert tag.params == ["p"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])